@@ -18,6 +18,8 @@ PYTHON DEPENDENCIES:
          https://unidata.github.io/netcdf4-python/netCDF4/index.html
 
 UPDATE HISTORY:
+    Updated 10/2026: read binary records with numpy structured data types
+        fields without a scale factor keep their integer types when unpacking
     Updated 08/2020: flake8 compatible binary regular expression strings
     Forked 02/2020 from read_cryosat_L2.py
     Updated 11/2019: empty placeholder dictionary for baseline D DSD headers
@@ -38,66 +40,88 @@ import pointCollection as pc
 import netCDF4
 import re
 import os
+import mmap
+from itertools import repeat
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor
+
+# CryoSat file class
+# OFFL (Off Line Processing/Systematic)
+# NRT_ (Near Real Time)
+# RPRO (ReProcessing)
+# TEST (Testing)
+# LTA_ (Long Term Archive)
+regex_class = 'OFFL|NRT_|RPRO|TEST|LTA_'
+# CryoSat mission products
+# SIR_LRM_2 L2 Product from Low Resolution Mode Processing
+# SIR_FDM_2 L2 Product from Fast Delivery Marine Mode Processing
+# SIR_SIN_2 L2 Product from SAR Interferometric Processing
+# SIR_SID_2 L2 Product from SIN Degraded Processing
+# SIR_SAR_2 L2 Product from SAR Processing
+# SIR_GDR_2 L2 Consolidated Product
+# SIR_LRMI2 In-depth L2 Product from LRM Processing
+# SIR_SINI2 In-depth L2 Product from SIN Processing
+# SIR_SIDI2 In-depth L2 Product from SIN Degraded Process.
+# SIR_SARI2 In-depth L2 Product from SAR Processing
+regex_products = ('SIR_LRM_2|SIR_FDM_2|SIR_SIN_2|SIR_SID_2|'
+    'SIR_SAR_2|SIR_GDR_2|SIR_LRMI2|SIR_SINI2|SIR_SIDI2|SIR_SARI2')
+# CRYOSAT LEVEL-2 PRODUCTS NAMING RULES
+# Mission Identifier
+# File Class
+# File Product
+# Validity Start Date and Time
+# Validity Stop Date and Time
+# Baseline Identifier
+# Version Number
+regex_pattern = r'(.*?)_({0})_({1})__(\d+T?\d+)_(\d+T?\d+)_(.*?)(\d+)'
+# compiled regular expression operators for reading filenames and headers
+_FILENAME_RX = re.compile(regex_pattern.format(regex_class,regex_products),re.VERBOSE)
+_NUMBER_RX = re.compile(r'[-+]?\d+')
+# PDS header fields within quotes and without quotes
+_MPH_QUOTED_RX = re.compile(br'(.*?)\=\"(.*)(?=\")')
+_MPH_BARE_RX = re.compile(br'(.*?)\=(.*)')
+# SPH header lines (printable characters only with no binary control characters)
+_SPH_LINE_RX = re.compile(br'[\x20-\x7e]*?\=[\x20-\x7e]*')
+# Level-2 CryoSat DS_NAMES within files
+_DSD_RX = re.compile(br'DS_NAME\="(?:'
+    br'SIR_LRM_L2(_I)?|SIR_LRMIL2|SIR_SAR_L2(A|B)?(_I)?|SIR_SARIL2(A|B)?|'
+    br'SIR_FDM_L2|SIR_SIN_L2(_I)?|SIR_SINIL2|SIR_SID_L2(_I)?|SIR_SIDIL2|'
+    br'SIR_GDR_2(A|B|_)?)[\s+]*"')
 
 class data(pc.data):
     np.seterr(invalid='ignore')
 
+    # default fields that get read from the CryoSat-2 file
+    # built once as a read-only mapping of tuples shared by all instances
+    _DEFAULT_FIELD_DICT = MappingProxyType({
+        'Data_1Hz':('Day','Second','Micsec','Lat_1Hz','Lon_1Hz',
+            'Alt_1Hz','Roll','Pitch','Yaw','N_valid'),
+        'Corrections':('dryTrop','wetTrop','InvBar','DAC','Iono','SSB',
+            'ocTideElv','lpeTideElv','olTideElv','seTideElv','gpTideElv','ODLE',
+            'Ice_conc','Snow_depth','Snow_density','C_status','SWH','Wind_speed'),
+        'Data_20Hz':('days_J2k','D_time_mics','Lat','Lon',
+            'Elev_1','Elev_2','Elev_3','Sig0_1','Sig0_2','Sig0_3','Freeboard',
+            'SSHA_interp','SSHA_interp_count','SSHA_interp_RMS','Peakiness','N_avg',
+            'Quality_flag','Corrections_flag','Quality_1','Quality_2','Quality_3'),
+        'METADATA':('MPH','SPH')})
+
     def __default_field_dict__(self):
         """
         Define the default fields that get read from the CryoSat-2 file
         """
-        field_dict = {}
-        field_dict['Data_1Hz'] = ['Day','Second','Micsec','Lat_1Hz','Lon_1Hz',
-            'Alt_1Hz','Roll','Pitch','Yaw','N_valid']
-        field_dict['Corrections'] = ['dryTrop','wetTrop','InvBar','DAC','Iono','SSB',
-            'ocTideElv','lpeTideElv','olTideElv','seTideElv','gpTideElv','ODLE',
-            'Ice_conc','Snow_depth','Snow_density','C_status','SWH','Wind_speed']
-        field_dict['Data_20Hz'] = ['days_J2k','D_time_mics','Lat','Lon',
-            'Elev_1','Elev_2','Elev_3','Sig0_1','Sig0_2','Sig0_3','Freeboard',
-            'SSHA_interp','SSHA_interp_count','SSHA_interp_RMS','Peakiness','N_avg',
-            'Quality_flag','Corrections_flag','Quality_1','Quality_2','Quality_3']
-        field_dict['METADATA'] = ['MPH','SPH']
-        return field_dict
+        return self._DEFAULT_FIELD_DICT
 
     def from_dbl(self, full_filename, field_dict=None, unpack=False, verbose=False):
         """
         Read CryoSat Level-1b data from binary formats
+        With unpack=True, fields without a scale factor (time parts, flags
+        and counts) keep their integer data types rather than becoming float
         """
         # file basename and file extension of input file
         fileBasename,fileExtension=os.path.splitext(os.path.basename(full_filename))
 
-        # CryoSat file class
-        # OFFL (Off Line Processing/Systematic)
-        # NRT_ (Near Real Time)
-        # RPRO (ReProcessing)
-        # TEST (Testing)
-        # LTA_ (Long Term Archive)
-        regex_class = 'OFFL|NRT_|RPRO|TEST|LTA_'
-        # CryoSat mission products
-        # SIR_LRM_2 L2 Product from Low Resolution Mode Processing
-        # SIR_FDM_2 L2 Product from Fast Delivery Marine Mode Processing
-        # SIR_SIN_2 L2 Product from SAR Interferometric Processing
-        # SIR_SID_2 L2 Product from SIN Degraded Processing
-        # SIR_SAR_2 L2 Product from SAR Processing
-        # SIR_GDR_2 L2 Consolidated Product
-        # SIR_LRMI2 In-depth L2 Product from LRM Processing
-        # SIR_SINI2 In-depth L2 Product from SIN Processing
-        # SIR_SIDI2 In-depth L2 Product from SIN Degraded Process.
-        # SIR_SARI2 In-depth L2 Product from SAR Processing
-        regex_products = ('SIR_LRM_2|SIR_FDM_2|SIR_SIN_2|SIR_SID_2|'
-        'SIR_SAR_2|SIR_GDR_2|SIR_LRMI2|SIR_SINI2|SIR_SIDI2|SIR_SARI2')
-        # CRYOSAT LEVEL-2 PRODUCTS NAMING RULES
-        # Mission Identifier
-        # File Class
-        # File Product
-        # Validity Start Date and Time
-        # Validity Stop Date and Time
-        # Baseline Identifier
-        # Version Number
-        regex_pattern = r'(.*?)_({0})_({1})__(\d+T?\d+)_(\d+T?\d+)_(.*?)(\d+)'
-        rx = re.compile(regex_pattern.format(regex_class,regex_products),re.VERBOSE)
         # extract file information from filename
-        MI,CLASS,PRODUCT,START,STOP,BASELINE,VERSION=rx.findall(fileBasename).pop()
+        MI,CLASS,PRODUCT,START,STOP,BASELINE,VERSION=_FILENAME_RX.findall(fileBasename).pop()
 
         # Record sizes
         CS_L2_MDS_REC_SIZE = 980
@@ -111,9 +135,7 @@ class data(pc.data):
             read_cryosat_variables = self.cryosat_baseline_AB
 
         # read the input file to get file information
-        fid = os.open(os.path.expanduser(full_filename),os.O_RDONLY)
-        file_info = os.fstat(fid)
-        os.close(fid)
+        file_info = os.stat(os.path.expanduser(full_filename))
 
         # num DSRs from SPH
         j_num_DSR = np.int32(file_info.st_size//i_record_size)
@@ -132,16 +154,23 @@ class data(pc.data):
         if (j_num_DSR*i_record_size != file_info.st_size):
             #-- If there are MPH/SPH/DSD headers
             s_MPH_fields = self.read_MPH(full_filename)
-            j_sph_size = np.int32(re.findall(r'[-+]?\d+',s_MPH_fields['SPH_SIZE']).pop())
-            s_SPH_fields = self.read_SPH(full_filename,j_sph_size)
+            j_sph_size = np.int32(_NUMBER_RX.findall(s_MPH_fields['SPH_SIZE']).pop())
+            #-- read the MPH (1247 bytes) and SPH blocks once
+            #-- and share the header lines for the SPH and DSD fields
+            n_MPH_bytes = 1247
+            with open(os.path.expanduser(full_filename), 'rb') as fid:
+                file_contents = fid.read(n_MPH_bytes + j_sph_size).splitlines()
+            s_SPH_fields = self.read_SPH(full_filename,j_sph_size,
+                file_contents=file_contents)
             #-- extract information from DSD fields
-            s_DSD_fields = self.read_DSD(full_filename)
+            s_DSD_fields = self.read_DSD(full_filename,j_sph_size=j_sph_size,
+                file_contents=file_contents)
             #-- extract DS_OFFSET
-            j_DS_start = np.int32(re.findall(r'[-+]?\d+',s_DSD_fields['DS_OFFSET']).pop())
+            j_DS_start = np.int32(_NUMBER_RX.findall(s_DSD_fields['DS_OFFSET']).pop())
             #-- extract number of DSR in the file
-            j_num_DSR = np.int32(re.findall(r'[-+]?\d+',s_DSD_fields['NUM_DSR']).pop())
+            j_num_DSR = np.int32(_NUMBER_RX.findall(s_DSD_fields['NUM_DSR']).pop())
             #-- check the record size
-            j_DSR_size = np.int32(re.findall(r'[-+]?\d+',s_DSD_fields['DSR_SIZE']).pop())
+            j_DSR_size = np.int32(_NUMBER_RX.findall(s_DSD_fields['DSR_SIZE']).pop())
             #--  minimum size is start of the read plus number of records to read
             j_check_size = j_DS_start +(j_DSR_size*j_num_DSR)
             if verbose:
@@ -152,32 +181,30 @@ class data(pc.data):
             if (j_check_size > file_info.st_size):
                 raise IOError('File size error')
             #-- extract binary data from input CryoSat data file (skip headers)
-            fid = open(os.path.expanduser(full_filename), 'rb')
-            cryosat_header = fid.read(j_DS_start)
-            # iterate through CryoSat file and fill output variables
-            CS_l2_mds = read_cryosat_variables(fid,j_num_DSR)
+            #-- memory map the file rather than reading into a buffer
+            with open(os.path.expanduser(full_filename), 'rb') as fid, \
+                mmap.mmap(fid.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # iterate through CryoSat file and fill output variables
+                CS_l2_mds = read_cryosat_variables(mm,j_num_DSR,offset=j_DS_start)
             # add headers to output dictionary as METADATA
             CS_l2_mds['METADATA'] = {}
             CS_l2_mds['METADATA']['MPH'] = s_MPH_fields
             CS_l2_mds['METADATA']['SPH'] = s_SPH_fields
             CS_l2_mds['METADATA']['DSD'] = s_DSD_fields
             # add absolute orbit number to 1Hz data
-            CS_l2_mds['Data_1Hz']['Abs_Orbit']=np.zeros((j_num_DSR),dtype=np.uint32)
-            CS_l2_mds['Data_1Hz']['Abs_Orbit'][:]=np.uint32(s_MPH_fields['ABS_ORBIT'])
+            # constant for the file so broadcast as a read-only view
+            CS_l2_mds['Data_1Hz']['Abs_Orbit']=np.broadcast_to(
+                np.uint32(s_MPH_fields['ABS_ORBIT']),(j_num_DSR,))
             # add ascending/descending flag to 1Hz data (A=ascending,D=descending)
-            CS_l2_mds['Data_1Hz']['Ascending_flag']=np.zeros((j_num_DSR),dtype=bool)
-            if (s_SPH_fields['ASCENDING_FLAG'] == 'A'):
-                CS_l2_mds['Data_1Hz']['Ascending_flag'][:] = True
-            # close the input CryoSat binary file
-            fid.close()
+            CS_l2_mds['Data_1Hz']['Ascending_flag']=np.broadcast_to(
+                np.bool_(s_SPH_fields['ASCENDING_FLAG'] == 'A'),(j_num_DSR,))
         else:
             # If there are not MPH/SPH/DSD headers
             # extract binary data from input CryoSat data file
-            fid = open(os.path.expanduser(full_filename), 'rb')
-            # iterate through CryoSat file and fill output variables
-            CS_l2_mds = read_cryosat_variables(fid,j_num_DSR)
-            # close the input CryoSat binary file
-            fid.close()
+            with open(os.path.expanduser(full_filename), 'rb') as fid, \
+                mmap.mmap(fid.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # iterate through CryoSat file and fill output variables
+                CS_l2_mds = read_cryosat_variables(mm,j_num_DSR)
 
         # if unpacking the units
         if unpack:
@@ -185,31 +212,37 @@ class data(pc.data):
             # for each dictionary key
             for group in CS_l2_scale.keys():
                 # for each scalable variable
+                # variables without a scale factor (flags, counts and time
+                # parts) are kept in their original packed integer types
                 for key,val in CS_l2_mds[group].items():
-                    if (val.dtype != bool):
-                        CS_l2_mds[group][key] = CS_l2_scale[group][key]*val.copy()
+                    if (val.dtype != bool) and (CS_l2_scale[group][key] != 1):
+                        CS_l2_mds[group][key] = CS_l2_scale[group][key]*val
 
-        # broadcast 1Hz time arrays to 20Hz
-        n_records,n_blocks = CS_l2_mds['Data_20Hz']['D_time_mics'].shape
-        Day = np.broadcast_to(CS_l2_mds['Data_1Hz']['Day'][:,None],(n_records,n_blocks))
-        Second = np.broadcast_to(CS_l2_mds['Data_1Hz']['Second'][:,None],(n_records,n_blocks))
-        Micsec = np.broadcast_to(CS_l2_mds['Data_1Hz']['Micsec'][:,None],(n_records,n_blocks))
+        # 1Hz time arrays as columns for broadcasting to 20Hz
+        Day = CS_l2_mds['Data_1Hz']['Day'][:,None]
+        Second = CS_l2_mds['Data_1Hz']['Second'][:,None]
+        Micsec = CS_l2_mds['Data_1Hz']['Micsec'][:,None]
         # calculate GPS time of CryoSat data (seconds since Jan 6, 1980 00:00:00)
         # from TAI time since Jan 1, 2000 00:00:00
         GPS_Time = self.calc_GPS_time(Day,Second,Micsec+CS_l2_mds['Data_20Hz']['D_time_mics'])
         # leap seconds for converting from GPS time to UTC time
         leap_seconds = self.count_leap_seconds(GPS_Time)
-        # calculate dates as J2000 days (UTC)
-        CS_l2_mds['Data_20Hz']['days_J2k'] = (GPS_Time - leap_seconds)/86400.0 - 7300.0
+        # calculate dates as J2000 days (UTC) reusing the GPS time array
+        GPS_Time -= leap_seconds
+        GPS_Time /= 86400.0
+        GPS_Time -= 7300.0
+        CS_l2_mds['Data_20Hz']['days_J2k'] = GPS_Time
 
         # parameters to extract
         if field_dict is None:
             field_dict = self.__default_field_dict__()
         # extract fields of interest using field dict keys
+        existing = set(self.fields)
         for group,variables in field_dict.items():
             for field in variables:
-                if field not in self.fields:
+                if field not in existing:
                     self.fields.append(field)
+                    existing.add(field)
                 setattr(self, field, CS_l2_mds[group][field])
 
         # update size and shape of input data
@@ -224,63 +257,39 @@ class data(pc.data):
         # file basename and file extension of input file
         fileBasename,fileExtension=os.path.splitext(os.path.basename(full_filename))
 
-        # CryoSat file class
-        # OFFL (Off Line Processing/Systematic)
-        # NRT_ (Near Real Time)
-        # RPRO (ReProcessing)
-        # TEST (Testing)
-        # LTA_ (Long Term Archive)
-        regex_class = 'OFFL|NRT_|RPRO|TEST|LTA_'
-        # CryoSat mission products
-        # SIR_LRM_2 L2 Product from Low Resolution Mode Processing
-        # SIR_FDM_2 L2 Product from Fast Delivery Marine Mode Processing
-        # SIR_SIN_2 L2 Product from SAR Interferometric Processing
-        # SIR_SID_2 L2 Product from SIN Degraded Processing
-        # SIR_SAR_2 L2 Product from SAR Processing
-        # SIR_GDR_2 L2 Consolidated Product
-        # SIR_LRMI2 In-depth L2 Product from LRM Processing
-        # SIR_SINI2 In-depth L2 Product from SIN Processing
-        # SIR_SIDI2 In-depth L2 Product from SIN Degraded Process.
-        # SIR_SARI2 In-depth L2 Product from SAR Processing
-        regex_products = ('SIR_LRM_2|SIR_FDM_2|SIR_SIN_2|SIR_SID_2|'
-        'SIR_SAR_2|SIR_GDR_2|SIR_LRMI2|SIR_SINI2|SIR_SIDI2|SIR_SARI2')
-        # CRYOSAT LEVEL-2 PRODUCTS NAMING RULES
-        # Mission Identifier
-        # File Class
-        # File Product
-        # Validity Start Date and Time
-        # Validity Stop Date and Time
-        # Baseline Identifier
-        # Version Number
-        regex_pattern = r'(.*?)_({0})_({1})__(\d+T?\d+)_(\d+T?\d+)_(.*?)(\d+)'
-        rx = re.compile(regex_pattern.format(regex_class,regex_products),re.VERBOSE)
         # extract file information from filename
-        MI,CLASS,PRODUCT,START,STOP,BASELINE,VERSION=rx.findall(fileBasename).pop()
+        MI,CLASS,PRODUCT,START,STOP,BASELINE,VERSION=_FILENAME_RX.findall(fileBasename).pop()
         print(full_filename) if verbose else None
+        # parameters to extract
+        if field_dict is None:
+            field_dict = self.__default_field_dict__()
         # read level-2 CryoSat-2 data from netCDF4 file
-        CS_l2_mds = self.cryosat_baseline_D(full_filename, unpack=unpack)
+        # only reading the variables for the fields of interest
+        CS_l2_mds = self.cryosat_baseline_D(full_filename, unpack=unpack,
+            field_dict=field_dict)
 
-        # broadcast 1Hz time arrays to 20Hz
-        n_records,n_blocks = CS_l2_mds['Data_20Hz']['D_time_mics'].shape
-        Day = np.broadcast_to(CS_l2_mds['Data_1Hz']['Day'][:,None],(n_records,n_blocks))
-        Second = np.broadcast_to(CS_l2_mds['Data_1Hz']['Second'][:,None],(n_records,n_blocks))
-        Micsec = np.broadcast_to(CS_l2_mds['Data_1Hz']['Micsec'][:,None],(n_records,n_blocks))
+        # 1Hz time arrays as columns for broadcasting to 20Hz
+        Day = CS_l2_mds['Data_1Hz']['Day'][:,None]
+        Second = CS_l2_mds['Data_1Hz']['Second'][:,None]
+        Micsec = CS_l2_mds['Data_1Hz']['Micsec'][:,None]
         # calculate GPS time of CryoSat data (seconds since Jan 6, 1980 00:00:00)
         # from TAI time since Jan 1, 2000 00:00:00
         GPS_Time = self.calc_GPS_time(Day,Second,Micsec+CS_l2_mds['Data_20Hz']['D_time_mics'])
         # leap seconds for converting from GPS time to UTC time
         leap_seconds = self.count_leap_seconds(GPS_Time)
-        # calculate dates as J2000 days (UTC)
-        CS_l2_mds['Data_20Hz']['days_J2k'] = (GPS_Time - leap_seconds)/86400.0 - 7300.0
+        # calculate dates as J2000 days (UTC) reusing the GPS time array
+        GPS_Time -= leap_seconds
+        GPS_Time /= 86400.0
+        GPS_Time -= 7300.0
+        CS_l2_mds['Data_20Hz']['days_J2k'] = GPS_Time
 
-        # parameters to extract
-        if field_dict is None:
-            field_dict = self.__default_field_dict__()
         # extract fields of interest using field dict keys
+        existing = set(self.fields)
         for group,variables in field_dict.items():
             for field in variables:
-                if field not in self.fields:
+                if field not in existing:
                     self.fields.append(field)
+                    existing.add(field)
                 setattr(self, field, CS_l2_mds[group][field])
 
         # update size and shape of input data
@@ -288,41 +297,71 @@ class data(pc.data):
         # return the data and header text
         return self
 
-    def calc_GPS_time(self, day, second, micsec):
+    @classmethod
+    def from_files(cls, filenames, field_dict=None, unpack=False, n_workers=None):
+        """
+        Read a list of CryoSat Level-2 files in parallel and concatenate
+        """
+        # header metadata can not be concatenated between files
+        if field_dict is None:
+            field_dict = {group:variables for group,variables in
+                cls._DEFAULT_FIELD_DICT.items() if (group != 'METADATA')}
+        # read each file in a separate process
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            D_list = list(executor.map(_read_file, filenames,
+                repeat(field_dict), repeat(unpack), chunksize=4))
+        # concatenate along records keeping the (n_records,20) shape
+        # of the 20Hz fields and the N_valid masks from each file
+        D = cls(field_dict=field_dict)
+        for field in D.fields:
+            val = [getattr(Di, field) for Di in D_list]
+            if any(np.ma.isMaskedArray(v) for v in val):
+                setattr(D, field, np.ma.concatenate(val, axis=0))
+            else:
+                setattr(D, field, np.concatenate(val, axis=0))
+        D.__update_size_and_shape__()
+        return D
+
+    @staticmethod
+    def calc_GPS_time(day, second, micsec):
         """
         Calculate the GPS time (seconds since Jan 6, 1980 00:00:00)
         """
         # TAI time is ahead of GPS by 19 seconds
-        return (day + 7300.0)*86400.0 + second.astype('f') + micsec/1e6 - 19
+        # accumulate in place in double precision to limit temporary arrays
+        GPS_Time = np.true_divide(micsec, 1e6)
+        GPS_Time += second
+        GPS_Time += (day + 7300.0)*86400.0
+        GPS_Time -= 19.0
+        return GPS_Time
 
-    def count_leap_seconds(self, GPS_Time):
+    @staticmethod
+    def count_leap_seconds(GPS_Time):
         """
         Count number of leap seconds that have passed for given GPS times
         """
         # GPS times for leap seconds
-        leaps = [46828800, 78364801, 109900802, 173059203, 252028804, 315187205,
-            346723206, 393984007, 425520008, 457056009, 504489610, 551750411,
-            599184012, 820108813, 914803214, 1025136015, 1119744016, 1167264017]
+        leaps = np.array([46828800, 78364801, 109900802, 173059203, 252028804,
+            315187205, 346723206, 393984007, 425520008, 457056009, 504489610,
+            551750411, 599184012, 820108813, 914803214, 1025136015, 1119744016,
+            1167264017])
         # number of leap seconds prior to GPS_Time
-        n_leaps = np.zeros_like(GPS_Time)
-        for i,leap in enumerate(leaps):
-            count = np.count_nonzero(GPS_Time >= leap)
-            if (count > 0):
-                i_records,i_blocks = np.nonzero(GPS_Time >= leap)
-                n_leaps[i_records,i_blocks] += 1.0
+        n_leaps = np.searchsorted(leaps, GPS_Time, side='right').astype(np.float64)
         return n_leaps
 
     def read_MPH(self, full_filename):
         """
         Read ASCII Main Product Header (MPH) block from an ESA PDS file
         """
-        # read input data file
-        with open(os.path.expanduser(full_filename), 'rb') as fid:
-            file_contents = fid.read().splitlines()
-
         # Define constant values associated with PDS file formats
         # number of text lines in standard MPH
         n_MPH_lines = 41
+        # number of bytes in standard MPH
+        n_MPH_bytes = 1247
+        # read MPH block from input data file
+        with open(os.path.expanduser(full_filename), 'rb') as fid:
+            file_contents = fid.read(n_MPH_bytes).splitlines()
+
         # check that first line of header matches PRODUCT
         if not bool(re.match(br'PRODUCT\=\"(.*)(?=\")',file_contents[0])):
             raise IOError('File does not start with a valid PDS MPH')
@@ -330,67 +369,62 @@ class data(pc.data):
         s_MPH_fields = {}
         for i in range(n_MPH_lines):
             # use regular expression operators to read headers
-            if bool(re.match(br'(.*?)\=\"(.*)(?=\")',file_contents[i])):
-                # data fields within quotes
-                field,value=re.findall(br'(.*?)\=\"(.*)(?=\")',file_contents[i]).pop()
-                s_MPH_fields[field.decode('utf-8')] = value.decode('utf-8').rstrip()
-            elif bool(re.match(br'(.*?)\=(.*)',file_contents[i])):
-                # data fields without quotes
-                field,value=re.findall(br'(.*?)\=(.*)',file_contents[i]).pop()
+            # data fields within quotes or data fields without quotes
+            m = (_MPH_QUOTED_RX.match(file_contents[i]) or
+                _MPH_BARE_RX.match(file_contents[i]))
+            if m:
+                field,value = m.groups()
                 s_MPH_fields[field.decode('utf-8')] = value.decode('utf-8').rstrip()
 
         # Return block name array to calling function
         return s_MPH_fields
 
-    def read_SPH(self, full_filename, j_sph_size):
+    def read_SPH(self, full_filename, j_sph_size, file_contents=None):
         """
         Read ASCII Specific Product Header (SPH) block from a PDS file
         """
-        # read input data file
-        with open(os.path.expanduser(full_filename), 'rb') as fid:
-            file_contents = fid.read().splitlines()
-
         # Define constant values associated with PDS file formats
         # number of text lines in standard MPH
         n_MPH_lines = 41
-        # compile regular expression operator for reading headers
-        rx = re.compile(br'(.*?)\=\"?(.*)',re.VERBOSE)
+        # number of bytes in standard MPH
+        n_MPH_bytes = 1247
+        # read MPH and SPH blocks from input data file
+        # header lines can be passed from a previous read of the file
+        if file_contents is None:
+            with open(os.path.expanduser(full_filename), 'rb') as fid:
+                file_contents = fid.read(n_MPH_bytes + j_sph_size).splitlines()
+
         # check first line of header matches SPH_DESCRIPTOR
         if not bool(re.match(br'SPH\_DESCRIPTOR\=',file_contents[n_MPH_lines+1])):
             raise IOError('File does not have a valid PDS DSD')
         # read SPH header text (no binary control characters)
-        s_SPH_lines = [li for li in file_contents[n_MPH_lines+1:] if rx.match(li)
-            and not re.search(br'[^\x20-\x7e]+',li)]
+        s_SPH_lines = [li for li in file_contents[n_MPH_lines+1:] if
+            _SPH_LINE_RX.fullmatch(li)]
 
         # extract SPH header text
         s_SPH_fields = {}
         c = 0
         while (c < len(s_SPH_lines)):
+            # use regular expression operators to read headers
+            # data fields within quotes or data fields without quotes
+            m = (_MPH_QUOTED_RX.match(s_SPH_lines[c]) or
+                _MPH_BARE_RX.match(s_SPH_lines[c]))
             # check if line is within DS_NAME portion of SPH header
-            if bool(re.match(br'DS_NAME',s_SPH_lines[c])):
+            if s_SPH_lines[c].startswith(b'DS_NAME'):
                 # add dictionary for DS_NAME
-                field,value=re.findall(br'(.*?)\=\"(.*)(?=\")',s_SPH_lines[c]).pop()
+                field,value=_MPH_QUOTED_RX.match(s_SPH_lines[c]).groups()
                 key = value.decode('utf-8').rstrip()
                 s_SPH_fields[key] = {}
                 for line in s_SPH_lines[c+1:c+7]:
-                    if bool(re.match(br'(.*?)\=\"(.*)(?=\")',line)):
-                        # data fields within quotes
-                        dsfield,dsvalue=re.findall(br'(.*?)\=\"(.*)(?=\")',line).pop()
-                        s_SPH_fields[key][dsfield.decode('utf-8')] = dsvalue.decode('utf-8').rstrip()
-                    elif bool(re.match(br'(.*?)\=(.*)',line)):
-                        # data fields without quotes
-                        dsfield,dsvalue=re.findall(br'(.*?)\=(.*)',line).pop()
+                    # data fields within quotes or data fields without quotes
+                    dsm = (_MPH_QUOTED_RX.match(line) or _MPH_BARE_RX.match(line))
+                    if dsm:
+                        dsfield,dsvalue = dsm.groups()
                         s_SPH_fields[key][dsfield.decode('utf-8')] = dsvalue.decode('utf-8').rstrip()
                 # add 6 to counter to go to next entry
                 c += 6
-            # use regular expression operators to read headers
-            elif bool(re.match(br'(.*?)\=\"(.*)(?=\")',s_SPH_lines[c])):
-                # data fields within quotes
-                field,value=re.findall(br'(.*?)\=\"(.*)(?=\")',s_SPH_lines[c]).pop()
-                s_SPH_fields[field.decode('utf-8')] = value.decode('utf-8').rstrip()
-            elif bool(re.match(br'(.*?)\=(.*)',s_SPH_lines[c])):
-                # data fields without quotes
-                field,value=re.findall(br'(.*?)\=(.*)',s_SPH_lines[c]).pop()
+            elif m:
+                field,value = m.groups()
                 s_SPH_fields[field.decode('utf-8')] = value.decode('utf-8').rstrip()
             # add 1 to counter to go to next line
             c += 1
@@ -398,533 +432,317 @@ class data(pc.data):
         # Return block name array to calling function
         return s_SPH_fields
 
-    def read_DSD(self, full_filename, DS_TYPE=None):
+    def read_DSD(self, full_filename, DS_TYPE=None, j_sph_size=None,
+        file_contents=None):
         """
         Read ASCII Data Set Descriptors (DSD) block from a PDS file
         """
-        # read input data file
-        with open(os.path.expanduser(full_filename), 'rb') as fid:
-            file_contents = fid.read().splitlines()
-
         # Define constant values associated with PDS file formats
         # number of text lines in standard MPH
         n_MPH_lines = 41
+        # number of bytes in standard MPH
+        n_MPH_bytes = 1247
+        # read MPH and SPH blocks from input data file (DSDs are within SPH)
+        # read the entire file if the size of the SPH is not known
+        # header lines can be passed from a previous read of the file
+        if file_contents is None:
+            n_bytes = -1 if (j_sph_size is None) else (n_MPH_bytes + j_sph_size)
+            with open(os.path.expanduser(full_filename), 'rb') as fid:
+                file_contents = fid.read(n_bytes).splitlines()
+
         # number of text lines in a DSD header
         n_DSD_lines = 8
 
-        # Level-2 CryoSat DS_NAMES within files
-        regex_patterns = []
-        regex_patterns.append(br'DS_NAME\="SIR_LRM_L2(_I)?[\s+]*"')
-        regex_patterns.append(br'DS_NAME\="SIR_LRMIL2[\s+]*"')
-        regex_patterns.append(br'DS_NAME\="SIR_SAR_L2(A|B)?(_I)?[\s+]*"')
-        regex_patterns.append(br'DS_NAME\="SIR_SARIL2(A|B)?[\s+]*"')
-        regex_patterns.append(br'DS_NAME\="SIR_FDM_L2[\s+]*"')
-        regex_patterns.append(br'DS_NAME\="SIR_SIN_L2(_I)?[\s+]*"')
-        regex_patterns.append(br'DS_NAME\="SIR_SINIL2[\s+]*"')
-        regex_patterns.append(br'DS_NAME\="SIR_SID_L2(_I)?[\s+]*"')
-        regex_patterns.append(br'DS_NAME\="SIR_SIDIL2[\s+]*"')
-        regex_patterns.append(br'DS_NAME\="SIR_GDR_2(A|B|_)?[\s+]*"')
         # find the DSD starting line within the SPH header
-        c = 0
-        Flag = False
-        while ((Flag is False) and (c < len(regex_patterns))):
-            # find indice within
-            indice = [i for i,line in enumerate(file_contents[n_MPH_lines+1:]) if
-                re.search(regex_patterns[c],line)]
-            if indice:
-                Flag = True
-            else:
-                c+=1
+        # stopping at the first line matching any Level-2 DS_NAME
+        indice = next((i for i,line in enumerate(file_contents[n_MPH_lines+1:])
+            if _DSD_RX.search(line)), None)
         # check that valid indice was found within header
-        if not indice:
+        if indice is None:
             raise IOError('Can not find correct DSD field')
 
         # extract s_DSD_fields info
-        DSD_START = n_MPH_lines + indice[0] + 1
+        DSD_START = n_MPH_lines + indice + 1
         s_DSD_fields = {}
         for i in range(DSD_START,DSD_START+n_DSD_lines):
             # use regular expression operators to read headers
-            if bool(re.match(br'(.*?)\=\"(.*)(?=\")',file_contents[i])):
-                # data fields within quotes
-                field,value=re.findall(br'(.*?)\=\"(.*)(?=\")',file_contents[i]).pop()
-                s_DSD_fields[field.decode('utf-8')] = value.decode('utf-8').rstrip()
-            elif bool(re.match(br'(.*?)\=(.*)',file_contents[i])):
-                # data fields without quotes
-                field,value=re.findall(br'(.*?)\=(.*)',file_contents[i]).pop()
+            # data fields within quotes or data fields without quotes
+            m = (_MPH_QUOTED_RX.match(file_contents[i]) or
+                _MPH_BARE_RX.match(file_contents[i]))
+            if m:
+                field,value = m.groups()
                 s_DSD_fields[field.decode('utf-8')] = value.decode('utf-8').rstrip()
 
         # Return block name array to calling function
         return s_DSD_fields
 
-    def cryosat_baseline_AB(self, fid, n_records):
+    def cryosat_columns(self, mds):
         """
-        Read L2 MDS variables for CryoSat Baselines A and B
+        Copy CryoSat MDS records into contiguous native-endian variables
+        allocated from a single buffer
         """
-        # Bind all the bits of the l2_mds together into a single dictionary
-        CS_l2_mds = {}
-        # CryoSat-2 1 Hz data fields (Location Group)
-        # Time and Orbit Parameters plus Measurement Mode
-        CS_l2_mds['Data_1Hz'] = {}
-        # Time: day part
-        CS_l2_mds['Data_1Hz']['Day'] = np.zeros((n_records),dtype=np.int32)
-        # Time: second part
-        CS_l2_mds['Data_1Hz']['Second'] = np.zeros((n_records),dtype=np.int32)
-        # Time: microsecond part
-        CS_l2_mds['Data_1Hz']['Micsec'] = np.zeros((n_records),dtype=np.int32)
-        # SIRAL mode
-        CS_l2_mds['Data_1Hz']['Siral_mode'] = np.zeros((n_records),dtype=np.uint64)
-        # Lat_1Hz: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_1Hz']['Lat_1Hz'] = np.zeros((n_records),dtype=np.int32)
-        # Lon_1Hz: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_1Hz']['Lon_1Hz'] = np.zeros((n_records),dtype=np.int32)
-        # Alt_1Hz: packed units (mm, 1e-3 m)
-        # Altitude of COG above reference ellipsoid (interpolated value)
-        CS_l2_mds['Data_1Hz']['Alt_1Hz'] = np.zeros((n_records),dtype=np.int32)
-        # Mispointing: packed units (millidegrees, 1e-3 degrees)
-        CS_l2_mds['Data_1Hz']['Mispointing'] = np.zeros((n_records),dtype=np.int16)
-        # Number of valid records in the block of twenty that contain data
-        # Last few records of the last block of a dataset may be blank blocks
-        # inserted to bring the file up to a multiple of twenty.
-        CS_l2_mds['Data_1Hz']['N_valid'] = np.zeros((n_records),dtype=np.int16)
+        # native byte order data type, shape and offset of each variable
+        # offsets are padded to 8 bytes to keep each variable aligned
+        columns = []
+        n_bytes = 0
+        for group in mds.dtype.names:
+            for key in mds[group].dtype.names:
+                dtype = mds[group].dtype[key].newbyteorder('=')
+                columns.append((group,key,dtype,n_bytes))
+                n_bytes += -(-mds[group].size*dtype.itemsize//8)*8
+        # allocate the buffer and copy each variable into its slice
+        buffer = np.empty((n_bytes),dtype=np.uint8)
+        CS_l2_mds = {group:{} for group in mds.dtype.names}
+        for group,key,dtype,offset in columns:
+            shape = mds[group].shape
+            count = mds[group].size*dtype.itemsize
+            CS_l2_mds[group][key] = buffer[offset:offset+count].view(dtype).reshape(shape)
+            CS_l2_mds[group][key][...] = mds[group][key]
+        return CS_l2_mds
 
+    def cryosat_records(self, buffer, n_records, dtype_1Hz, dtype_20Hz, offset=0):
+        """
+        Read L2 MDS records for CryoSat Baselines A, B and C
+        """
         # CryoSat-2 geophysical corrections (External corrections Group)
-        CS_l2_mds['Corrections'] = {}
-        # Dry Tropospheric Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['dryTrop'] = np.zeros((n_records),dtype=np.int16)
-        # Wet Tropospheric Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['wetTrop'] = np.zeros((n_records),dtype=np.int16)
-        # Inverse Barometric Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['InvBar'] = np.zeros((n_records),dtype=np.int16)
-        # Dynamic Atmosphere Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['DAC'] = np.zeros((n_records),dtype=np.int16)
-        # Ionospheric Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['Iono'] = np.zeros((n_records),dtype=np.int16)
-        # Sea State Bias Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['SSB'] = np.zeros((n_records),dtype=np.int16)
-        # Ocean tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['ocTideElv'] = np.zeros((n_records),dtype=np.int16)
-        # Long period equilibrium ocean tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['lpeTideElv'] = np.zeros((n_records),dtype=np.int16)
-        # Ocean loading tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['olTideElv'] = np.zeros((n_records),dtype=np.int16)
-        # Solid Earth tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['seTideElv'] = np.zeros((n_records),dtype=np.int16)
-        # Geocentric Polar tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['gpTideElv'] = np.zeros((n_records),dtype=np.int16)
-        CS_l2_mds['Corrections']['Spare1'] = np.zeros((n_records),dtype=np.int16)
-        # Surface Type: Packed in groups of three bits for each of the 20 records
-        CS_l2_mds['Corrections']['Surf_type'] = np.zeros((n_records),dtype=np.uint64)
-        # Mean Sea Surface or Geoid packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['MSS_Geoid'] = np.zeros((n_records),dtype=np.int32)
-        # Ocean Depth/Land Elevation Model (ODLE) packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['ODLE'] = np.zeros((n_records),dtype=np.int32)
-        # Ice Concentration packed units (%/100)
-        CS_l2_mds['Corrections']['Ice_conc'] = np.zeros((n_records),dtype=np.int16)
-        # Snow Depth packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['Snow_depth'] = np.zeros((n_records),dtype=np.int16)
-        # Snow Density packed units (kg/m^3)
-        CS_l2_mds['Corrections']['Snow_density'] = np.zeros((n_records),dtype=np.int16)
-        CS_l2_mds['Corrections']['Spare2'] = np.zeros((n_records),dtype=np.int16)
-        # Corrections Status Flag
-        CS_l2_mds['Corrections']['C_status'] = np.zeros((n_records),dtype=np.uint32)
-        # Significant Wave Height (SWH) packed units (mm, 1e-3)
-        CS_l2_mds['Corrections']['SWH'] = np.zeros((n_records),dtype=np.int16)
-        # Wind Speed packed units (mm/s, 1e-3 m/s)
-        CS_l2_mds['Corrections']['Wind_speed'] = np.zeros((n_records),dtype=np.uint16)
-        CS_l2_mds['Corrections']['Spare3'] = np.zeros((n_records),dtype=np.int16)
-        CS_l2_mds['Corrections']['Spare4'] = np.zeros((n_records),dtype=np.int16)
-        CS_l2_mds['Corrections']['Spare5'] = np.zeros((n_records),dtype=np.int16)
-        CS_l2_mds['Corrections']['Spare6'] = np.zeros((n_records),dtype=np.int16)
+        dtype_corrections = np.dtype([
+            # Dry Tropospheric Correction packed units (mm, 1e-3 m)
+            ('dryTrop','>i2'),
+            # Wet Tropospheric Correction packed units (mm, 1e-3 m)
+            ('wetTrop','>i2'),
+            # Inverse Barometric Correction packed units (mm, 1e-3 m)
+            ('InvBar','>i2'),
+            # Dynamic Atmosphere Correction packed units (mm, 1e-3 m)
+            ('DAC','>i2'),
+            # Ionospheric Correction packed units (mm, 1e-3 m)
+            ('Iono','>i2'),
+            # Sea State Bias Correction packed units (mm, 1e-3 m)
+            ('SSB','>i2'),
+            # Ocean tide Correction packed units (mm, 1e-3 m)
+            ('ocTideElv','>i2'),
+            # Long period equilibrium ocean tide Correction packed units (mm, 1e-3 m)
+            ('lpeTideElv','>i2'),
+            # Ocean loading tide Correction packed units (mm, 1e-3 m)
+            ('olTideElv','>i2'),
+            # Solid Earth tide Correction packed units (mm, 1e-3 m)
+            ('seTideElv','>i2'),
+            # Geocentric Polar tide Correction packed units (mm, 1e-3 m)
+            ('gpTideElv','>i2'),
+            ('Spare1','>i2'),
+            # Surface Type: Packed in groups of three bits for each of the 20 records
+            ('Surf_type','>u8'),
+            # Mean Sea Surface or Geoid packed units (mm, 1e-3 m)
+            ('MSS_Geoid','>i4'),
+            # Ocean Depth/Land Elevation Model (ODLE) packed units (mm, 1e-3 m)
+            ('ODLE','>i4'),
+            # Ice Concentration packed units (%/100)
+            ('Ice_conc','>i2'),
+            # Snow Depth packed units (mm, 1e-3 m)
+            ('Snow_depth','>i2'),
+            # Snow Density packed units (kg/m^3)
+            ('Snow_density','>i2'),
+            ('Spare2','>i2'),
+            # Corrections Status Flag
+            ('C_status','>u4'),
+            # Significant Wave Height (SWH) packed units (mm, 1e-3)
+            ('SWH','>i2'),
+            # Wind Speed packed units (mm/s, 1e-3 m/s)
+            ('Wind_speed','>u2'),
+            ('Spare3','>i2'),
+            ('Spare4','>i2'),
+            ('Spare5','>i2'),
+            ('Spare6','>i2')])
 
         # CryoSat-2 20 Hz data fields (Measurement Group)
-        # Derived from instrument measurement parameters
         n_blocks = 20
-        CS_l2_mds['Data_20Hz'] = {}
-        # Delta between the timestamps for 20Hz record and the 1Hz record
-        # D_time_mics packed units (microseconds)
-        CS_l2_mds['Data_20Hz']['D_time_mics'] = np.ma.zeros((n_records,n_blocks),dtype=np.int32)
-        CS_l2_mds['Data_20Hz']['D_time_mics'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Lat: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_20Hz']['Lat'] = np.ma.zeros((n_records,n_blocks),dtype=np.int32)
-        CS_l2_mds['Data_20Hz']['Lat'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Lon: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_20Hz']['Lon'] = np.ma.zeros((n_records,n_blocks),dtype=np.int32)
-        CS_l2_mds['Data_20Hz']['Lon'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Measured elevation above ellipsoid from retracker: packed units (mm, 1e-3 m)
-        CS_l2_mds['Data_20Hz']['Elev'] = np.ma.zeros((n_records,n_blocks),dtype=np.int32)
-        CS_l2_mds['Data_20Hz']['Elev'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Interpolated Sea Surface Height Anomaly: packed units (mm, 1e-3 m)
-        CS_l2_mds['Data_20Hz']['SSHA_interp'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['SSHA_interp'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Interpolated Sea Surface Height measurement count
-        CS_l2_mds['Data_20Hz']['SSHA_interp_count'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['SSHA_interp_count'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Interpolation quality estimate RSS: packed units (mm, 1e-3 m)
-        CS_l2_mds['Data_20Hz']['SSHA_interp_RMS'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['SSHA_interp_RMS'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Sigma Zero Backscatter for retracker: packed units (1e-2 dB)
-        CS_l2_mds['Data_20Hz']['Sig0'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['Sig0'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Peakiness: packed units (1e-2)
-        CS_l2_mds['Data_20Hz']['Peakiness'] = np.ma.zeros((n_records,n_blocks),dtype=np.uint16)
-        CS_l2_mds['Data_20Hz']['Peakiness'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Freeboard: packed units (mm, 1e-3 m)
-        # -9999 default value indicates computation has not been performed
-        CS_l2_mds['Data_20Hz']['Freeboard'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['Freeboard'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Number of averaged echoes or beams
-        CS_l2_mds['Data_20Hz']['N_avg'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['N_avg'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        CS_l2_mds['Data_20Hz']['Spare1'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['Spare1'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Quality flags
-        CS_l2_mds['Data_20Hz']['Quality_flag'] = np.ma.zeros((n_records,n_blocks),dtype=np.uint32)
-        CS_l2_mds['Data_20Hz']['Quality_flag'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        CS_l2_mds['Data_20Hz']['Spare2'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['Spare2'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        CS_l2_mds['Data_20Hz']['Spare3'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['Spare3'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        CS_l2_mds['Data_20Hz']['Spare4'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['Spare4'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        CS_l2_mds['Data_20Hz']['Spare5'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['Spare5'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # for each record in the CryoSat file
-        for r in range(n_records):
-            # CryoSat-2 Location Group for record r
-            CS_l2_mds['Data_1Hz']['Day'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Second'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Micsec'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Siral_mode'][r] = np.fromfile(fid,dtype='>u8',count=1)
-            CS_l2_mds['Data_1Hz']['Lat_1Hz'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Lon_1Hz'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Alt_1Hz'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Mispointing'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Data_1Hz']['N_valid'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            # CryoSat-2 External CS_l2_mds['Corrections'] Group for record r
-            CS_l2_mds['Corrections']['dryTrop'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['wetTrop'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['InvBar'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['DAC'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Iono'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['SSB'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['ocTideElv'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['lpeTideElv'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['olTideElv'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['seTideElv'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['gpTideElv'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Spare1'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Surf_type'][r] = np.fromfile(fid,dtype='>u8',count=1)
-            CS_l2_mds['Corrections']['MSS_Geoid'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Corrections']['ODLE'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Corrections']['Ice_conc'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Snow_depth'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Snow_density'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Spare2'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['C_status'][r] = np.fromfile(fid,dtype='>u4',count=1)
-            CS_l2_mds['Corrections']['SWH'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Wind_speed'][r] = np.fromfile(fid,dtype='>u2',count=1)
-            CS_l2_mds['Corrections']['Spare3'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Spare4'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Spare5'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Spare6'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            # CryoSat-2 Measurements Group for record r and block b
-            for b in range(n_blocks):
-                CS_l2_mds['Data_20Hz']['D_time_mics'].data[r,b] = np.fromfile(fid,dtype='>i4',count=1)
-                CS_l2_mds['Data_20Hz']['Lat'].data[r,b] = np.fromfile(fid,dtype='>i4',count=1)
-                CS_l2_mds['Data_20Hz']['Lon'].data[r,b] = np.fromfile(fid,dtype='>i4',count=1)
-                CS_l2_mds['Data_20Hz']['Elev'].data[r,b] = np.fromfile(fid,dtype='>i4',count=1)
-                CS_l2_mds['Data_20Hz']['SSHA_interp'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['SSHA_interp_count'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['SSHA_interp_RMS'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['Sig0'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['Peakiness'].data[r,b] = np.fromfile(fid,dtype='>u2',count=1)
-                CS_l2_mds['Data_20Hz']['Freeboard'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['N_avg'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['Spare1'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['Quality_flag'].data[r,b] = np.fromfile(fid,dtype='>u4',count=1)
-                CS_l2_mds['Data_20Hz']['Spare2'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['Spare3'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['Spare4'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['Spare5'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-            # Set CryoSat-2 Measurements Group Masks for record r
-            nv = CS_l2_mds['Data_1Hz']['N_valid'][r]
-            CS_l2_mds['Data_20Hz']['D_time_mics'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Lat'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Lon'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Elev'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['SSHA_interp'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['SSHA_interp_count'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['SSHA_interp_RMS'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Sig0'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Peakiness'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Freeboard'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['N_avg'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Spare1'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Quality_flag'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Spare2'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Spare3'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Spare4'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Spare5'].mask[r,:nv] = False
+        # CryoSat-2 L2 MDS record
+        dtype_mds = np.dtype([('Data_1Hz',dtype_1Hz),
+            ('Corrections',dtype_corrections),
+            ('Data_20Hz',dtype_20Hz,(n_blocks,))])
+        # view all records from the mapped CryoSat file without copying
+        mds = np.frombuffer(buffer, dtype=dtype_mds, count=n_records, offset=offset)
+
+        # Bind all the bits of the l2_mds together into a single dictionary
+        # variables are contiguous columns rather than views of the records
+        CS_l2_mds = self.cryosat_columns(mds)
+        # CryoSat-2 Measurements Group mask from the number of valid records
+        # each 20 Hz variable gets a copy as masked assignments are in place
+        mask = np.arange(n_blocks) >= CS_l2_mds['Data_1Hz']['N_valid'][:,None]
+        for key in dtype_20Hz.names:
+            CS_l2_mds['Data_20Hz'][key] = np.ma.array(CS_l2_mds['Data_20Hz'][key],
+                mask=mask.copy(), copy=False)
 
         # return the output dictionary
         return CS_l2_mds
 
-    def cryosat_baseline_C(self, fid, n_records):
+    def cryosat_baseline_AB(self, buffer, n_records, offset=0):
         """
-        Read L2 MDS variables for CryoSat Baseline C
+        Read L2 MDS variables for CryoSat Baselines A and B
         """
-        # Bind all the bits of the l2_mds together into a single dictionary
-        CS_l2_mds = {}
         # CryoSat-2 1 Hz data fields (Location Group)
         # Time and Orbit Parameters plus Measurement Mode
-        CS_l2_mds['Data_1Hz'] = {}
-        # Time: day part
-        CS_l2_mds['Data_1Hz']['Day'] = np.zeros((n_records),dtype=np.int32)
-        # Time: second part
-        CS_l2_mds['Data_1Hz']['Second'] = np.zeros((n_records),dtype=np.int32)
-        # Time: microsecond part
-        CS_l2_mds['Data_1Hz']['Micsec'] = np.zeros((n_records),dtype=np.int32)
-        # SIRAL mode
-        CS_l2_mds['Data_1Hz']['Siral_mode'] = np.zeros((n_records),dtype=np.uint64)
-        # Lat_1Hz: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_1Hz']['Lat_1Hz'] = np.zeros((n_records),dtype=np.int32)
-        # Lon_1Hz: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_1Hz']['Lon_1Hz'] = np.zeros((n_records),dtype=np.int32)
-        # Alt_1Hz: packed units (mm, 1e-3 m)
-        # Altitude of COG above reference ellipsoid (interpolated value)
-        CS_l2_mds['Data_1Hz']['Alt_1Hz'] = np.zeros((n_records),dtype=np.int32)
-        # Roll: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_1Hz']['Roll'] = np.zeros((n_records),dtype=np.int32)
-        # Pitch: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_1Hz']['Pitch'] = np.zeros((n_records),dtype=np.int32)
-        # Yaw: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_1Hz']['Yaw'] = np.zeros((n_records),dtype=np.int32)
-        CS_l2_mds['Data_1Hz']['Spare'] = np.zeros((n_records),dtype=np.int16)
-        # Number of valid records in the block of twenty that contain data
-        # Last few records of the last block of a dataset may be blank blocks
-        # inserted to bring the file up to a multiple of twenty.
-        CS_l2_mds['Data_1Hz']['N_valid'] = np.zeros((n_records),dtype=np.int16)
+        dtype_1Hz = np.dtype([
+            # Time: day part
+            ('Day','>i4'),
+            # Time: second part
+            ('Second','>i4'),
+            # Time: microsecond part
+            ('Micsec','>i4'),
+            # SIRAL mode
+            ('Siral_mode','>u8'),
+            # Lat_1Hz: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Lat_1Hz','>i4'),
+            # Lon_1Hz: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Lon_1Hz','>i4'),
+            # Alt_1Hz: packed units (mm, 1e-3 m)
+            # Altitude of COG above reference ellipsoid (interpolated value)
+            ('Alt_1Hz','>i4'),
+            # Mispointing: packed units (millidegrees, 1e-3 degrees)
+            ('Mispointing','>i2'),
+            # Number of valid records in the block of twenty that contain data
+            # Last few records of the last block of a dataset may be blank blocks
+            # inserted to bring the file up to a multiple of twenty.
+            ('N_valid','>i2')])
 
-        # CryoSat-2 geophysical corrections (External corrections Group)
-        CS_l2_mds['Corrections'] = {}
-        # Dry Tropospheric Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['dryTrop'] = np.zeros((n_records),dtype=np.int16)
-        # Wet Tropospheric Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['wetTrop'] = np.zeros((n_records),dtype=np.int16)
-        # Inverse Barometric Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['InvBar'] = np.zeros((n_records),dtype=np.int16)
-        # Dynamic Atmosphere Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['DAC'] = np.zeros((n_records),dtype=np.int16)
-        # Ionospheric Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['Iono'] = np.zeros((n_records),dtype=np.int16)
-        # Sea State Bias Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['SSB'] = np.zeros((n_records),dtype=np.int16)
-        # Ocean tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['ocTideElv'] = np.zeros((n_records),dtype=np.int16)
-        # Long period equilibrium ocean tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['lpeTideElv'] = np.zeros((n_records),dtype=np.int16)
-        # Ocean loading tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['olTideElv'] = np.zeros((n_records),dtype=np.int16)
-        # Solid Earth tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['seTideElv'] = np.zeros((n_records),dtype=np.int16)
-        # Geocentric Polar tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['gpTideElv'] = np.zeros((n_records),dtype=np.int16)
-        CS_l2_mds['Corrections']['Spare1'] = np.zeros((n_records),dtype=np.int16)
-        # Surface Type: Packed in groups of three bits for each of the 20 records
-        CS_l2_mds['Corrections']['Surf_type'] = np.zeros((n_records),dtype=np.uint64)
-        # Mean Sea Surface or Geoid packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['MSS_Geoid'] = np.zeros((n_records),dtype=np.int32)
-        # Ocean Depth/Land Elevation Model (ODLE) packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['ODLE'] = np.zeros((n_records),dtype=np.int32)
-        # Ice Concentration packed units (%/100)
-        CS_l2_mds['Corrections']['Ice_conc'] = np.zeros((n_records),dtype=np.int16)
-        # Snow Depth packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['Snow_depth'] = np.zeros((n_records),dtype=np.int16)
-        # Snow Density packed units (kg/m^3)
-        CS_l2_mds['Corrections']['Snow_density'] = np.zeros((n_records),dtype=np.int16)
-        CS_l2_mds['Corrections']['Spare2'] = np.zeros((n_records),dtype=np.int16)
-        # Corrections Status Flag
-        CS_l2_mds['Corrections']['C_status'] = np.zeros((n_records),dtype=np.uint32)
-        # Significant Wave Height (SWH) packed units (mm, 1e-3)
-        CS_l2_mds['Corrections']['SWH'] = np.zeros((n_records),dtype=np.int16)
-        # Wind Speed packed units (mm/s, 1e-3 m/s)
-        CS_l2_mds['Corrections']['Wind_speed'] = np.zeros((n_records),dtype=np.uint16)
-        CS_l2_mds['Corrections']['Spare3'] = np.zeros((n_records),dtype=np.int16)
-        CS_l2_mds['Corrections']['Spare4'] = np.zeros((n_records),dtype=np.int16)
-        CS_l2_mds['Corrections']['Spare5'] = np.zeros((n_records),dtype=np.int16)
-        CS_l2_mds['Corrections']['Spare6'] = np.zeros((n_records),dtype=np.int16)
+        # CryoSat-2 20 Hz data fields (Measurement Group)
+        # Derived from instrument measurement parameters
+        dtype_20Hz = np.dtype([
+            # Delta between the timestamps for 20Hz record and the 1Hz record
+            # D_time_mics packed units (microseconds)
+            ('D_time_mics','>i4'),
+            # Lat: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Lat','>i4'),
+            # Lon: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Lon','>i4'),
+            # Measured elevation above ellipsoid from retracker: packed units (mm, 1e-3 m)
+            ('Elev','>i4'),
+            # Interpolated Sea Surface Height Anomaly: packed units (mm, 1e-3 m)
+            ('SSHA_interp','>i2'),
+            # Interpolated Sea Surface Height measurement count
+            ('SSHA_interp_count','>i2'),
+            # Interpolation quality estimate RSS: packed units (mm, 1e-3 m)
+            ('SSHA_interp_RMS','>i2'),
+            # Sigma Zero Backscatter for retracker: packed units (1e-2 dB)
+            ('Sig0','>i2'),
+            # Peakiness: packed units (1e-2)
+            ('Peakiness','>u2'),
+            # Freeboard: packed units (mm, 1e-3 m)
+            # -9999 default value indicates computation has not been performed
+            ('Freeboard','>i2'),
+            # Number of averaged echoes or beams
+            ('N_avg','>i2'),
+            ('Spare1','>i2'),
+            # Quality flags
+            ('Quality_flag','>u4'),
+            ('Spare2','>i2'),
+            ('Spare3','>i2'),
+            ('Spare4','>i2'),
+            ('Spare5','>i2')])
+
+        # read the CryoSat-2 L2 MDS records (980 bytes)
+        return self.cryosat_records(buffer, n_records, dtype_1Hz, dtype_20Hz,
+            offset=offset)
+
+    def cryosat_baseline_C(self, buffer, n_records, offset=0):
+        """
+        Read L2 MDS variables for CryoSat Baseline C
+        """
+        # CryoSat-2 1 Hz data fields (Location Group)
+        # Time and Orbit Parameters plus Measurement Mode
+        dtype_1Hz = np.dtype([
+            # Time: day part
+            ('Day','>i4'),
+            # Time: second part
+            ('Second','>i4'),
+            # Time: microsecond part
+            ('Micsec','>i4'),
+            # SIRAL mode
+            ('Siral_mode','>u8'),
+            # Lat_1Hz: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Lat_1Hz','>i4'),
+            # Lon_1Hz: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Lon_1Hz','>i4'),
+            # Alt_1Hz: packed units (mm, 1e-3 m)
+            # Altitude of COG above reference ellipsoid (interpolated value)
+            ('Alt_1Hz','>i4'),
+            # Roll: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Roll','>i4'),
+            # Pitch: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Pitch','>i4'),
+            # Yaw: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Yaw','>i4'),
+            ('Spare','>i2'),
+            # Number of valid records in the block of twenty that contain data
+            # Last few records of the last block of a dataset may be blank blocks
+            # inserted to bring the file up to a multiple of twenty.
+            ('N_valid','>i2')])
 
         # CryoSat-2 20 Hz data fields (Measurement Group)
         # Derived from instrument measurement parameters
-        n_blocks = 20
-        CS_l2_mds['Data_20Hz'] = {}
-        # Delta between the timestamps for 20Hz record and the 1Hz record
-        # D_time_mics packed units (microseconds)
-        CS_l2_mds['Data_20Hz']['D_time_mics'] = np.ma.zeros((n_records,n_blocks),dtype=np.int32)
-        CS_l2_mds['Data_20Hz']['D_time_mics'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Lat: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_20Hz']['Lat'] = np.ma.zeros((n_records,n_blocks),dtype=np.int32)
-        CS_l2_mds['Data_20Hz']['Lat'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Lon: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_20Hz']['Lon'] = np.ma.zeros((n_records,n_blocks),dtype=np.int32)
-        CS_l2_mds['Data_20Hz']['Lon'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Measured elevation above ellipsoid from retracker 1: packed units (mm, 1e-3 m)
-        CS_l2_mds['Data_20Hz']['Elev_1'] = np.ma.zeros((n_records,n_blocks),dtype=np.int32)
-        CS_l2_mds['Data_20Hz']['Elev_1'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Measured elevation above ellipsoid from retracker 2: packed units (mm, 1e-3 m)
-        CS_l2_mds['Data_20Hz']['Elev_2'] = np.ma.zeros((n_records,n_blocks),dtype=np.int32)
-        CS_l2_mds['Data_20Hz']['Elev_2'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Measured elevation above ellipsoid from retracker 3: packed units (mm, 1e-3 m)
-        CS_l2_mds['Data_20Hz']['Elev_3'] = np.ma.zeros((n_records,n_blocks),dtype=np.int32)
-        CS_l2_mds['Data_20Hz']['Elev_3'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Sigma Zero Backscatter for retracker 1: packed units (1e-2 dB)
-        CS_l2_mds['Data_20Hz']['Sig0_1'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['Sig0_1'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Sigma Zero Backscatter for retracker 2: packed units (1e-2 dB)
-        CS_l2_mds['Data_20Hz']['Sig0_2'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['Sig0_2'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Sigma Zero Backscatter for retracker 3: packed units (1e-2 dB)
-        CS_l2_mds['Data_20Hz']['Sig0_3'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['Sig0_3'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Freeboard: packed units (mm, 1e-3 m)
-        # -9999 default value indicates computation has not been performed
-        CS_l2_mds['Data_20Hz']['Freeboard'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['Freeboard'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Interpolated Sea Surface Height Anomaly: packed units (mm, 1e-3 m)
-        CS_l2_mds['Data_20Hz']['SSHA_interp'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['SSHA_interp'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Interpolated Sea Surface Height measurement count
-        CS_l2_mds['Data_20Hz']['SSHA_interp_count'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['SSHA_interp_count'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Interpolation quality estimate RSS: packed units (mm, 1e-3 m)
-        CS_l2_mds['Data_20Hz']['SSHA_interp_RMS'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['SSHA_interp_RMS'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Peakiness: packed units (1e-2)
-        CS_l2_mds['Data_20Hz']['Peakiness'] = np.ma.zeros((n_records,n_blocks),dtype=np.uint16)
-        CS_l2_mds['Data_20Hz']['Peakiness'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Number of averaged echoes or beams
-        CS_l2_mds['Data_20Hz']['N_avg'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['N_avg'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        CS_l2_mds['Data_20Hz']['Spare1'] = np.ma.zeros((n_records,n_blocks),dtype=np.int16)
-        CS_l2_mds['Data_20Hz']['Spare1'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Quality flags
-        CS_l2_mds['Data_20Hz']['Quality_flag'] = np.ma.zeros((n_records,n_blocks),dtype=np.uint32)
-        CS_l2_mds['Data_20Hz']['Quality_flag'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Corrections Application Flag
-        CS_l2_mds['Data_20Hz']['Corrections_flag'] = np.ma.zeros((n_records,n_blocks),dtype=np.uint32)
-        CS_l2_mds['Data_20Hz']['Corrections_flag'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Quality metric for retracker 1
-        CS_l2_mds['Data_20Hz']['Quality_1'] = np.ma.zeros((n_records,n_blocks),dtype=np.int32)
-        CS_l2_mds['Data_20Hz']['Quality_1'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Quality metric for retracker 2
-        CS_l2_mds['Data_20Hz']['Quality_2'] = np.ma.zeros((n_records,n_blocks),dtype=np.int32)
-        CS_l2_mds['Data_20Hz']['Quality_2'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # Quality metric for retracker 3
-        CS_l2_mds['Data_20Hz']['Quality_3'] = np.ma.zeros((n_records,n_blocks),dtype=np.int32)
-        CS_l2_mds['Data_20Hz']['Quality_3'].mask = np.ones((n_records,n_blocks),dtype=bool)
-        # for each record in the CryoSat file
-        for r in range(n_records):
-            # CryoSat-2 Location Group for record r
-            CS_l2_mds['Data_1Hz']['Day'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Second'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Micsec'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Siral_mode'][r] = np.fromfile(fid,dtype='>u8',count=1)
-            CS_l2_mds['Data_1Hz']['Lat_1Hz'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Lon_1Hz'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Alt_1Hz'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Roll'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Pitch'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Yaw'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Data_1Hz']['Spare'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Data_1Hz']['N_valid'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            # CryoSat-2 External CS_l2_mds['Corrections'] Group for record r
-            CS_l2_mds['Corrections']['dryTrop'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['wetTrop'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['InvBar'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['DAC'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Iono'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['SSB'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['ocTideElv'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['lpeTideElv'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['olTideElv'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['seTideElv'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['gpTideElv'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Spare1'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Surf_type'][r] = np.fromfile(fid,dtype='>u8',count=1)
-            CS_l2_mds['Corrections']['MSS_Geoid'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Corrections']['ODLE'][r] = np.fromfile(fid,dtype='>i4',count=1)
-            CS_l2_mds['Corrections']['Ice_conc'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Snow_depth'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Snow_density'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Spare2'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['C_status'][r] = np.fromfile(fid,dtype='>u4',count=1)
-            CS_l2_mds['Corrections']['SWH'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Wind_speed'][r] = np.fromfile(fid,dtype='>u2',count=1)
-            CS_l2_mds['Corrections']['Spare3'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Spare4'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Spare5'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            CS_l2_mds['Corrections']['Spare6'][r] = np.fromfile(fid,dtype='>i2',count=1)
-            # CryoSat-2 Measurements Group for record r and block b
-            for b in range(n_blocks):
-                CS_l2_mds['Data_20Hz']['D_time_mics'].data[r,b] = np.fromfile(fid,dtype='>i4',count=1)
-                CS_l2_mds['Data_20Hz']['Lat'].data[r,b] = np.fromfile(fid,dtype='>i4',count=1)
-                CS_l2_mds['Data_20Hz']['Lon'].data[r,b] = np.fromfile(fid,dtype='>i4',count=1)
-                CS_l2_mds['Data_20Hz']['Elev_1'].data[r,b] = np.fromfile(fid,dtype='>i4',count=1)
-                CS_l2_mds['Data_20Hz']['Elev_2'].data[r,b] = np.fromfile(fid,dtype='>i4',count=1)
-                CS_l2_mds['Data_20Hz']['Elev_3'].data[r,b] = np.fromfile(fid,dtype='>i4',count=1)
-                CS_l2_mds['Data_20Hz']['Sig0_1'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['Sig0_2'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['Sig0_3'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['Freeboard'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['SSHA_interp'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['SSHA_interp_count'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['SSHA_interp_RMS'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['Peakiness'].data[r,b] = np.fromfile(fid,dtype='>u2',count=1)
-                CS_l2_mds['Data_20Hz']['N_avg'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['Spare1'].data[r,b] = np.fromfile(fid,dtype='>i2',count=1)
-                CS_l2_mds['Data_20Hz']['Quality_flag'].data[r,b] = np.fromfile(fid,dtype='>u4',count=1)
-                CS_l2_mds['Data_20Hz']['Corrections_flag'].data[r,b] = np.fromfile(fid,dtype='>u4',count=1)
-                CS_l2_mds['Data_20Hz']['Quality_1'].data[r,b] = np.fromfile(fid,dtype='>i4',count=1)
-                CS_l2_mds['Data_20Hz']['Quality_2'].data[r,b] = np.fromfile(fid,dtype='>i4',count=1)
-                CS_l2_mds['Data_20Hz']['Quality_3'].data[r,b] = np.fromfile(fid,dtype='>i4',count=1)
-            # Set CryoSat-2 Measurements Group Masks for record r
-            nv = CS_l2_mds['Data_1Hz']['N_valid'][r]
-            CS_l2_mds['Data_20Hz']['D_time_mics'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Lat'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Lon'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Elev_1'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Elev_2'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Elev_3'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Sig0_1'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Sig0_2'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Sig0_3'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Freeboard'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['SSHA_interp'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['SSHA_interp_count'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['SSHA_interp_RMS'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Peakiness'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['N_avg'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Spare1'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Quality_flag'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Corrections_flag'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Quality_1'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Quality_2'].mask[r,:nv] = False
-            CS_l2_mds['Data_20Hz']['Quality_3'].mask[r,:nv] = False
+        dtype_20Hz = np.dtype([
+            # Delta between the timestamps for 20Hz record and the 1Hz record
+            # D_time_mics packed units (microseconds)
+            ('D_time_mics','>i4'),
+            # Lat: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Lat','>i4'),
+            # Lon: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Lon','>i4'),
+            # Measured elevation above ellipsoid from retracker 1: packed units (mm, 1e-3 m)
+            ('Elev_1','>i4'),
+            # Measured elevation above ellipsoid from retracker 2: packed units (mm, 1e-3 m)
+            ('Elev_2','>i4'),
+            # Measured elevation above ellipsoid from retracker 3: packed units (mm, 1e-3 m)
+            ('Elev_3','>i4'),
+            # Sigma Zero Backscatter for retracker 1: packed units (1e-2 dB)
+            ('Sig0_1','>i2'),
+            # Sigma Zero Backscatter for retracker 2: packed units (1e-2 dB)
+            ('Sig0_2','>i2'),
+            # Sigma Zero Backscatter for retracker 3: packed units (1e-2 dB)
+            ('Sig0_3','>i2'),
+            # Freeboard: packed units (mm, 1e-3 m)
+            # -9999 default value indicates computation has not been performed
+            ('Freeboard','>i2'),
+            # Interpolated Sea Surface Height Anomaly: packed units (mm, 1e-3 m)
+            ('SSHA_interp','>i2'),
+            # Interpolated Sea Surface Height measurement count
+            ('SSHA_interp_count','>i2'),
+            # Interpolation quality estimate RSS: packed units (mm, 1e-3 m)
+            ('SSHA_interp_RMS','>i2'),
+            # Peakiness: packed units (1e-2)
+            ('Peakiness','>u2'),
+            # Number of averaged echoes or beams
+            ('N_avg','>i2'),
+            ('Spare1','>i2'),
+            # Quality flags
+            ('Quality_flag','>u4'),
+            # Corrections Application Flag
+            ('Corrections_flag','>u4'),
+            # Quality metric for retracker 1
+            ('Quality_1','>i4'),
+            # Quality metric for retracker 2
+            ('Quality_2','>i4'),
+            # Quality metric for retracker 3
+            ('Quality_3','>i4')])
 
-        # return the output dictionary
-        return CS_l2_mds
+        # read the CryoSat-2 L2 MDS records (1392 bytes)
+        return self.cryosat_records(buffer, n_records, dtype_1Hz, dtype_20Hz,
+            offset=offset)
 
-    def cryosat_baseline_D(self, full_filename, unpack=False):
+    def cryosat_baseline_D(self, full_filename, unpack=False, field_dict=None):
         """
         Read L2 MDS variables for CryoSat Baseline D (netCDF4)
+        Reads all variables unless a field_dict of variables is given
         """
         # open netCDF4 file for reading
         fid = netCDF4.Dataset(os.path.expanduser(full_filename),'r')
         # use original unscaled units unless unpack=True
         fid.set_auto_scale(unpack)
+        # netCDF4 variables and global attributes of the file
+        variables = fid.variables
+        attributes = {att:fid.getncattr(att) for att in fid.ncattrs()}
         # get dimensions
-        n_records, = fid.variables['time_cor_01'].shape
-        time_cor_01 = fid.variables['time_cor_01'][:].copy()
+        n_records, = variables['time_cor_01'].shape
+        time_cor_01 = variables['time_cor_01'][:]
 
         # Bind all the variables of the l2_mds together into a single dictionary
         CS_l2_mds = {}
@@ -932,368 +750,304 @@ class data(pc.data):
         # Time and Orbit Parameters plus Measurement Mode
         CS_l2_mds['Data_1Hz'] = {}
         # Time (seconds since 2000-01-01)
-        CS_l2_mds['Data_1Hz']['Time'] = time_cor_01.copy()
+        CS_l2_mds['Data_1Hz']['Time'] = time_cor_01
+        # split time into day, second and microsecond parts
+        # using integer arithmetic on the nearest whole microsecond
+        micsec = np.rint(time_cor_01*1e6).astype(np.int64)
+        day,micsec = np.divmod(micsec, 86400000000)
+        second,micsec = np.divmod(micsec, 1000000)
         # Time: day part
-        CS_l2_mds['Data_1Hz']['Day'] = np.array(time_cor_01/86400.0,dtype=np.int32)
+        CS_l2_mds['Data_1Hz']['Day'] = np.array(day,dtype=np.int32)
         # Time: second part
-        CS_l2_mds['Data_1Hz']['Second'] = np.array(time_cor_01-CS_l2_mds['Data_1Hz']['Day'][:]*86400.0,dtype=np.int32)
+        CS_l2_mds['Data_1Hz']['Second'] = np.array(second,dtype=np.int32)
         # Time: microsecond part
-        CS_l2_mds['Data_1Hz']['Micsec'] = np.array((time_cor_01-CS_l2_mds['Data_1Hz']['Day'][:]*86400.0-
-            CS_l2_mds['Data_1Hz']['Second'][:])*1e6,dtype=np.int32)
-        # Lat_1Hz: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_1Hz']['Lat_1Hz'] = fid.variables['lat_01'][:].copy()
-        # Lon_1Hz: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_1Hz']['Lon_1Hz'] = fid.variables['lon_01'][:].copy()
-        # Alt_1Hz: packed units (mm, 1e-3 m)
-        # Altitude of COG above reference ellipsoid (interpolated value)
-        CS_l2_mds['Data_1Hz']['Alt_1Hz'] = fid.variables['alt_01'][:].copy()
-        # Roll: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_1Hz']['Roll'] = fid.variables['off_nadir_roll_angle_str_01'][:].copy()
-        # Pitch: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_1Hz']['Pitch'] = fid.variables['off_nadir_pitch_angle_str_01'][:].copy()
-        # Yaw: packed units (0.1 micro-degree, 1e-7 degrees)
-        CS_l2_mds['Data_1Hz']['Yaw'] = fid.variables['off_nadir_yaw_angle_str_01'][:].copy()
-        # Number of valid records in the block of twenty that contain data
-        # Last few records of the last block of a dataset may be blank blocks
-        # inserted to bring the file up to a multiple of twenty.
-        CS_l2_mds['Data_1Hz']['N_valid'] = fid.variables['num_valid_01'][:].copy()
+        CS_l2_mds['Data_1Hz']['Micsec'] = np.array(micsec,dtype=np.int32)
+        # 1Hz output variables and the netCDF4 variables they are read from
+        variables_1Hz = [
+            # Lat_1Hz: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Lat_1Hz','lat_01'),
+            # Lon_1Hz: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Lon_1Hz','lon_01'),
+            # Alt_1Hz: packed units (mm, 1e-3 m)
+            # Altitude of COG above reference ellipsoid (interpolated value)
+            ('Alt_1Hz','alt_01'),
+            # Roll: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Roll','off_nadir_roll_angle_str_01'),
+            # Pitch: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Pitch','off_nadir_pitch_angle_str_01'),
+            # Yaw: packed units (0.1 micro-degree, 1e-7 degrees)
+            ('Yaw','off_nadir_yaw_angle_str_01'),
+            # Number of valid records in the block of twenty that contain data
+            # Last few records of the last block of a dataset may be blank blocks
+            # inserted to bring the file up to a multiple of twenty.
+            ('N_valid','num_valid_01')]
+        for key,var in variables_1Hz:
+            # number of valid records is always read for the 20Hz data
+            if (field_dict is None) or (key in field_dict.get('Data_1Hz',())) or \
+                (key == 'N_valid'):
+                CS_l2_mds['Data_1Hz'][key] = variables[var][:]
         # add absolute orbit number to 1Hz data
-        CS_l2_mds['Data_1Hz']['Abs_Orbit'] = np.zeros((n_records),dtype=np.uint32)
-        CS_l2_mds['Data_1Hz']['Abs_Orbit'][:] = np.uint32(fid.abs_orbit_number)
+        # constant for the file so broadcast as a read-only view
+        CS_l2_mds['Data_1Hz']['Abs_Orbit'] = np.broadcast_to(
+            np.uint32(attributes['abs_orbit_number']),(n_records,))
         # add ascending/descending flag to 1Hz data (A=ascending,D=descending)
-        CS_l2_mds['Data_1Hz']['Ascending_flag'] = np.zeros((n_records),dtype=bool)
-        CS_l2_mds['Data_1Hz']['Ascending_flag'][:] = (fid.ascending_flag == 'A')
+        CS_l2_mds['Data_1Hz']['Ascending_flag'] = np.broadcast_to(
+            np.bool_(attributes['ascending_flag'] == 'A'),(n_records,))
 
         # CryoSat-2 geophysical corrections (External corrections Group)
         CS_l2_mds['Corrections'] = {}
-        # Dry Tropospheric Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['dryTrop'] = fid.variables['mod_dry_tropo_cor_01'][:].copy()
-        # Wet Tropospheric Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['wetTrop'] = fid.variables['mod_wet_tropo_cor_01'][:].copy()
-        # Inverse Barometric Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['InvBar'] = fid.variables['inv_bar_cor_01'][:].copy()
-        # Dynamic Atmosphere Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['DAC'] = fid.variables['hf_fluct_total_cor_01'][:].copy()
-        # Ionospheric Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['Iono'] = fid.variables['iono_cor_01'][:].copy()
-        CS_l2_mds['Corrections']['Iono_GIM'] = fid.variables['iono_cor_gim_01'][:].copy()
-        # Sea State Bias Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['SSB'] = fid.variables['sea_state_bias_01_ku'][:].copy()
-        # Ocean tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['ocTideElv'] = fid.variables['ocean_tide_01'][:].copy()
-        # Long period equilibrium ocean tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['lpeTideElv'] = fid.variables['ocean_tide_eq_01'][:].copy()
-        # Ocean loading tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['olTideElv'] = fid.variables['load_tide_01'][:].copy()
-        # Solid Earth tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['seTideElv'] = fid.variables['solid_earth_tide_01'][:].copy()
-        # Geocentric Polar tide Correction packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['gpTideElv'] = fid.variables['pole_tide_01'][:].copy()
-        # Mean Sea Surface and Geoid packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['Geoid'] = fid.variables['geoid_01'][:].copy()
-        CS_l2_mds['Corrections']['MSS'] = fid.variables['mean_sea_surf_sea_ice_01'][:].copy()
-        # Ocean Depth/Land Elevation Model (ODLE) packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['ODLE'] = fid.variables['odle_01'][:].copy()
-        # Ice Concentration packed units (%/100)
-        CS_l2_mds['Corrections']['Ice_conc'] = fid.variables['sea_ice_concentration_01'][:].copy()
-        # Snow Depth packed units (mm, 1e-3 m)
-        CS_l2_mds['Corrections']['Snow_depth'] = fid.variables['snow_depth_01'][:].copy()
-        # Snow Density packed units (kg/m^3)
-        CS_l2_mds['Corrections']['Snow_density'] = fid.variables['snow_density_01'][:].copy()
-        # Corrections Status Flag
-        CS_l2_mds['Corrections']['C_status'] = fid.variables['flag_cor_err_01'][:].copy()
-        # Significant Wave Height (SWH) packed units (mm, 1e-3)
-        CS_l2_mds['Corrections']['SWH'] = fid.variables['swh_ocean_01_ku'][:].copy()
-        # Wind Speed packed units (mm/s, 1e-3 m/s)
-        CS_l2_mds['Corrections']['Wind_speed'] = fid.variables['wind_speed_alt_01_ku'][:].copy()
+        # correction output variables and the netCDF4 variables they are read from
+        variables_corrections = [
+            # Dry Tropospheric Correction packed units (mm, 1e-3 m)
+            ('dryTrop','mod_dry_tropo_cor_01'),
+            # Wet Tropospheric Correction packed units (mm, 1e-3 m)
+            ('wetTrop','mod_wet_tropo_cor_01'),
+            # Inverse Barometric Correction packed units (mm, 1e-3 m)
+            ('InvBar','inv_bar_cor_01'),
+            # Dynamic Atmosphere Correction packed units (mm, 1e-3 m)
+            ('DAC','hf_fluct_total_cor_01'),
+            # Ionospheric Correction packed units (mm, 1e-3 m)
+            ('Iono','iono_cor_01'),
+            ('Iono_GIM','iono_cor_gim_01'),
+            # Sea State Bias Correction packed units (mm, 1e-3 m)
+            ('SSB','sea_state_bias_01_ku'),
+            # Ocean tide Correction packed units (mm, 1e-3 m)
+            ('ocTideElv','ocean_tide_01'),
+            # Long period equilibrium ocean tide Correction packed units (mm, 1e-3 m)
+            ('lpeTideElv','ocean_tide_eq_01'),
+            # Ocean loading tide Correction packed units (mm, 1e-3 m)
+            ('olTideElv','load_tide_01'),
+            # Solid Earth tide Correction packed units (mm, 1e-3 m)
+            ('seTideElv','solid_earth_tide_01'),
+            # Geocentric Polar tide Correction packed units (mm, 1e-3 m)
+            ('gpTideElv','pole_tide_01'),
+            # Mean Sea Surface and Geoid packed units (mm, 1e-3 m)
+            ('Geoid','geoid_01'),
+            ('MSS','mean_sea_surf_sea_ice_01'),
+            # Ocean Depth/Land Elevation Model (ODLE) packed units (mm, 1e-3 m)
+            ('ODLE','odle_01'),
+            # Ice Concentration packed units (%/100)
+            ('Ice_conc','sea_ice_concentration_01'),
+            # Snow Depth packed units (mm, 1e-3 m)
+            ('Snow_depth','snow_depth_01'),
+            # Snow Density packed units (kg/m^3)
+            ('Snow_density','snow_density_01'),
+            # Corrections Status Flag
+            ('C_status','flag_cor_err_01'),
+            # Significant Wave Height (SWH) packed units (mm, 1e-3)
+            ('SWH','swh_ocean_01_ku'),
+            # Wind Speed packed units (mm/s, 1e-3 m/s)
+            ('Wind_speed','wind_speed_alt_01_ku')]
+        for key,var in variables_corrections:
+            if (field_dict is None) or (key in field_dict.get('Corrections',())):
+                CS_l2_mds['Corrections'][key] = variables[var][:]
 
         # CryoSat-2 20 Hz data fields (Measurement Group)
         # Derived from instrument measurement parameters
         n_blocks = 20
         CS_l2_mds['Data_20Hz'] = {}
-        # Time (seconds since 2000-01-01)
-        CS_l2_mds['Data_20Hz']['Time'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Time'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        time_20_ku = fid.variables['time_20_ku'][:].copy()
+        # 20Hz output variables and the netCDF4 variables they are read from
+        variables_20Hz = [
+            # Time (seconds since 2000-01-01)
+            ('Time','time_20_ku'),
+            # Lat: packed units
+            ('Lat','lat_poca_20_ku'),
+            # Lon: packed units
+            ('Lon','lon_poca_20_ku'),
+            # Measured elevation above ellipsoid from retracker 1
+            ('Elev_1','height_1_20_ku'),
+            # Measured elevation above ellipsoid from retracker 2
+            ('Elev_2','height_2_20_ku'),
+            # Measured elevation above ellipsoid from retracker 3
+            ('Elev_3','height_3_20_ku'),
+            # Sigma Zero Backscatter for retracker 1
+            ('Sig0_1','sig0_1_20_ku'),
+            # Sigma Zero Backscatter for retracker 2
+            ('Sig0_2','sig0_2_20_ku'),
+            # Sigma Zero Backscatter for retracker 3
+            ('Sig0_3','sig0_3_20_ku'),
+            # Measured range from the satellite CoM to the surface from retracker 1
+            ('Range_1','range_1_20_ku'),
+            # Measured range from the satellite CoM to the surface from retracker 2
+            ('Range_2','range_2_20_ku'),
+            # Measured range from the satellite CoM to the surface from retracker 3
+            ('Range_3','range_3_20_ku'),
+            # Freeboard
+            ('Freeboard','freeboard_20_ku'),
+            # Sea ice Floe height
+            ('Sea_Ice_Floe','height_sea_ice_floe_20_ku'),
+            # Sea ice lead height
+            ('Sea_Ice_Lead','height_sea_ice_lead_20_ku'),
+            # Interpolated Sea Surface Height Anomaly
+            ('SSHA_interp','ssha_interp_20_ku'),
+            # Interpolated Sea Surface Height measurement count
+            ('SSHA_interp_count','ssha_interp_numval_20_ku'),
+            # Interpolation quality estimate RSS
+            ('SSHA_interp_RMS','ssha_interp_rms_20_ku'),
+            # Peakiness
+            ('Peakiness','peakiness_20_ku'),
+            # Number of averaged echoes or beams
+            ('N_avg','echo_avg_numval_20_ku'),
+            # Quality flags
+            ('Quality_flag','flag_prod_status_20_ku'),
+            # Corrections Application Flag
+            ('Corrections_flag','flag_cor_applied_20_ku'),
+            # Measurement mode
+            ('Measurement_Mode','flag_instr_mode_op_20_ku'),
+            # Surface Type
+            ('Surf_type','surf_type_20_ku'),
+            # Quality metric for retracker 1
+            ('Quality_1','retracker_1_quality_20_ku'),
+            # Quality metric for retracker 2
+            ('Quality_2','retracker_2_quality_20_ku'),
+            # Quality metric for retracker 3
+            ('Quality_3','retracker_3_quality_20_ku')]
+        # CryoSat-2 Measurements Group mask from the number of valid records
+        N_valid = np.ma.getdata(CS_l2_mds['Data_1Hz']['N_valid'])
+        mask = np.arange(n_blocks) >= N_valid[:,None]
+        # record and block of each valid measurement and the indices of
+        # the measurements within the flattened netCDF4 20Hz variables
+        rec,blk = np.nonzero(np.logical_not(mask))
+        ind_first_meas = np.ma.getdata(variables['ind_first_meas_20hz_01'][:])
+        indices = ind_first_meas[rec] + blk
+        # check if all records are full and stored contiguously
+        contiguous = (indices.size == n_records*n_blocks) and \
+            np.array_equal(indices, np.arange(indices.size))
+        # read each 20Hz variable and gather into records and blocks
+        # each 20 Hz variable gets a copy as masked assignments are in place
+        for key,var in variables_20Hz:
+            # time is always read for calculating D_time_mics
+            if (field_dict is not None) and (key != 'Time') and \
+                (key not in field_dict.get('Data_20Hz',())):
+                continue
+            if contiguous:
+                # reshape the flattened variable directly into records
+                val = np.array(np.ma.getdata(variables[var][:indices.size]),
+                    dtype=np.float64).reshape(n_records,n_blocks)
+            else:
+                val = np.zeros((n_records,n_blocks))
+                val[rec,blk] = variables[var][:][indices]
+            CS_l2_mds['Data_20Hz'][key] = np.ma.array(val, mask=mask.copy(), copy=False)
         # Delta between the timestamps for 20Hz record and the 1Hz record
         # D_time_mics packed units (microseconds)
-        CS_l2_mds['Data_20Hz']['D_time_mics'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['D_time_mics'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        # Lat: packed units
-        CS_l2_mds['Data_20Hz']['Lat'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Lat'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        lat_poca_20_ku = fid.variables['lat_poca_20_ku'][:].copy()
-        # Lon: packed units
-        CS_l2_mds['Data_20Hz']['Lon'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Lon'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        lon_poca_20_ku = fid.variables['lon_poca_20_ku'][:].copy()
-        # Measured elevation above ellipsoid from retracker 1
-        CS_l2_mds['Data_20Hz']['Elev_1'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Elev_1'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        height_1_20_ku = fid.variables['height_1_20_ku'][:].copy()
-        # Measured elevation above ellipsoid from retracker 2
-        CS_l2_mds['Data_20Hz']['Elev_2'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Elev_2'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        height_2_20_ku = fid.variables['height_2_20_ku'][:].copy()
-        # Measured elevation above ellipsoid from retracker 3
-        CS_l2_mds['Data_20Hz']['Elev_3'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Elev_3'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        height_3_20_ku = fid.variables['height_3_20_ku'][:].copy()
-        # Sigma Zero Backscatter for retracker 1
-        CS_l2_mds['Data_20Hz']['Sig0_1'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Sig0_1'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        sig0_1_20_ku = fid.variables['sig0_1_20_ku'][:].copy()
-        # Sigma Zero Backscatter for retracker 2
-        CS_l2_mds['Data_20Hz']['Sig0_2'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Sig0_2'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        sig0_2_20_ku = fid.variables['sig0_2_20_ku'][:].copy()
-        # Sigma Zero Backscatter for retracker 3
-        CS_l2_mds['Data_20Hz']['Sig0_3'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Sig0_3'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        sig0_3_20_ku = fid.variables['sig0_3_20_ku'][:].copy()
-        # Measured range from the satellite CoM to the surface from retracker 1
-        CS_l2_mds['Data_20Hz']['Range_1'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Range_1'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        range_1_20_ku = fid.variables['range_1_20_ku'][:].copy()
-        # Measured range from the satellite CoM to the surface from retracker 2
-        CS_l2_mds['Data_20Hz']['Range_2'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Range_2'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        range_2_20_ku = fid.variables['range_2_20_ku'][:].copy()
-        # Measured range from the satellite CoM to the surface from retracker 3
-        CS_l2_mds['Data_20Hz']['Range_3'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Range_3'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        range_3_20_ku = fid.variables['range_3_20_ku'][:].copy()
-        # Freeboard
-        CS_l2_mds['Data_20Hz']['Freeboard'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Freeboard'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        freeboard_20_ku = fid.variables['freeboard_20_ku'][:].copy()
-        # Sea ice Floe height
-        CS_l2_mds['Data_20Hz']['Sea_Ice_Lead'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Sea_Ice_Lead'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        height_sea_ice_floe_20_ku = fid.variables['height_sea_ice_floe_20_ku'][:].copy()
-        # Sea ice lead height
-        CS_l2_mds['Data_20Hz']['Sea_Ice_Floe'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Sea_Ice_Floe'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        height_sea_ice_lead_20_ku = fid.variables['height_sea_ice_lead_20_ku'][:].copy()
-        # Interpolated Sea Surface Height Anomaly
-        CS_l2_mds['Data_20Hz']['SSHA_interp'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['SSHA_interp'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        ssha_interp_20_ku = fid.variables['ssha_interp_20_ku'][:].copy()
-        # Interpolated Sea Surface Height measurement count
-        CS_l2_mds['Data_20Hz']['SSHA_interp_count'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['SSHA_interp_count'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        ssha_interp_numval_20_ku = fid.variables['ssha_interp_numval_20_ku'][:].copy()
-        # Interpolation quality estimate RSS
-        CS_l2_mds['Data_20Hz']['SSHA_interp_RMS'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['SSHA_interp_RMS'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        ssha_interp_rms_20_ku = fid.variables['ssha_interp_rms_20_ku'][:].copy()
-        # Peakiness
-        CS_l2_mds['Data_20Hz']['Peakiness'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Peakiness'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        peakiness_20_ku = fid.variables['peakiness_20_ku'][:].copy()
-        # Number of averaged echoes or beams
-        CS_l2_mds['Data_20Hz']['N_avg'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['N_avg'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        echo_avg_numval_20_ku = fid.variables['echo_avg_numval_20_ku'][:].copy()
-        # Quality flags
-        CS_l2_mds['Data_20Hz']['Quality_flag'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Quality_flag'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        flag_prod_status_20_ku = fid.variables['flag_prod_status_20_ku'][:].copy()
-        # Corrections Application Flag
-        CS_l2_mds['Data_20Hz']['Corrections_flag'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Corrections_flag'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        flag_cor_applied_20_ku = fid.variables['flag_cor_applied_20_ku'][:].copy()
-        # Measurement mode
-        CS_l2_mds['Data_20Hz']['Measurement_Mode'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Measurement_Mode'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        flag_instr_mode_op_20_ku = fid.variables['flag_instr_mode_op_20_ku'][:].copy()
-        # Surface Type
-        CS_l2_mds['Data_20Hz']['Surf_type'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Surf_type'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        surf_type_20_ku = fid.variables['surf_type_20_ku'][:].copy()
-        # Quality metric for retracker 1
-        CS_l2_mds['Data_20Hz']['Quality_1'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Quality_1'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        retracker_1_quality_20_ku = fid.variables['retracker_1_quality_20_ku'][:].copy()
-        # Quality metric for retracker 2
-        CS_l2_mds['Data_20Hz']['Quality_2'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Quality_2'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        retracker_2_quality_20_ku = fid.variables['retracker_2_quality_20_ku'][:].copy()
-        # Quality metric for retracker 3
-        CS_l2_mds['Data_20Hz']['Quality_3'] = np.ma.zeros((n_records,n_blocks))
-        CS_l2_mds['Data_20Hz']['Quality_3'].mask = np.ma.ones((n_records,n_blocks),dtype=bool)
-        retracker_3_quality_20_ku = fid.variables['retracker_3_quality_20_ku'][:].copy()
-        # for each record in the CryoSat file
-        for r in range(n_records):
-            # index for record r
-            idx = fid.variables['ind_first_meas_20hz_01'][r].copy()
-            # number of valid blocks in record r
-            cnt = np.copy(fid.variables['num_valid_01'][r])
-            # CryoSat-2 Measurements Group for record r
-            CS_l2_mds['Data_20Hz']['Time'].data[r,:cnt] = time_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Time'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['D_time_mics'].data[r,:cnt] = 1e6*(time_20_ku[idx:idx+cnt] - time_cor_01[r])
-            CS_l2_mds['Data_20Hz']['D_time_mics'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Lat'].data[r,:cnt] = lat_poca_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Lat'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Lon'].data[r,:cnt] = lon_poca_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Lon'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Elev_1'].data[r,:cnt] = height_1_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Elev_1'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Elev_2'].data[r,:cnt] = height_2_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Elev_2'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Elev_3'].data[r,:cnt] = height_3_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Elev_3'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Sig0_1'].data[r,:cnt] = sig0_1_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Sig0_1'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Sig0_2'].data[r,:cnt] = sig0_2_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Sig0_2'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Sig0_3'].data[r,:cnt] = sig0_3_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Sig0_3'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Range_1'].data[r,:cnt] = range_1_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Range_1'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Range_2'].data[r,:cnt] = range_2_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Range_2'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Range_3'].data[r,:cnt] = range_3_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Range_3'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Freeboard'].data[r,:cnt] = freeboard_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Freeboard'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Sea_Ice_Floe'].data[r,:cnt] = height_sea_ice_floe_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Sea_Ice_Floe'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Sea_Ice_Lead'].data[r,:cnt] = height_sea_ice_lead_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Sea_Ice_Lead'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['SSHA_interp'].data[r,:cnt] = ssha_interp_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['SSHA_interp'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['SSHA_interp_count'].data[r,:cnt] = ssha_interp_numval_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['SSHA_interp_count'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['SSHA_interp_RMS'].data[r,:cnt] = ssha_interp_rms_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['SSHA_interp_RMS'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Peakiness'].data[r,:cnt] = peakiness_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Peakiness'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['N_avg'].data[r,:cnt] = echo_avg_numval_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['N_avg'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Quality_flag'].data[r,:cnt] = flag_prod_status_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Quality_flag'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Corrections_flag'].data[r,:cnt] = flag_cor_applied_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Corrections_flag'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Measurement_Mode'].data[r,:cnt] = flag_instr_mode_op_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Measurement_Mode'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Surf_type'].data[r,:cnt] = surf_type_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Surf_type'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Quality_1'].data[r,:cnt] = retracker_1_quality_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Quality_1'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Quality_2'].data[r,:cnt] = retracker_2_quality_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Quality_2'].mask[r,:cnt] = False
-            CS_l2_mds['Data_20Hz']['Quality_3'].data[r,:cnt] = retracker_3_quality_20_ku[idx:idx+cnt].copy()
-            CS_l2_mds['Data_20Hz']['Quality_3'].mask[r,:cnt] = False
+        val = np.zeros((n_records,n_blocks))
+        val[rec,blk] = 1e6*(CS_l2_mds['Data_20Hz']['Time'].data[rec,blk] - time_cor_01[rec])
+        CS_l2_mds['Data_20Hz']['D_time_mics'] = np.ma.array(val, mask=mask.copy(), copy=False)
 
         # extract global attributes and assign as MPH and SPH metadata
+        # MPH metadata keys and the global attributes they are read from
+        MPH_attributes = [
+            ('PRODUCT','product_name'),
+            ('DOI','doi'),
+            ('PROC_STAGE','processing_stage'),
+            ('REF_DOC','reference_document'),
+            ('ACQUISITION_STATION','acquisition_station'),
+            ('PROC_CENTER','processing_centre'),
+            ('PROC_TIME','creation_time'),
+            ('SOFTWARE_VER','software_version'),
+            ('SENSING_START','sensing_start'),
+            ('SENSING_STOP','sensing_stop'),
+            ('PHASE','phase'),
+            ('CYCLE','cycle_number'),
+            ('REL_ORBIT','rel_orbit_number'),
+            ('ABS_ORBIT','abs_orbit_number'),
+            ('STATE_VECTOR_TIME','state_vector_time'),
+            ('DELTA_UT1','delta_ut1'),
+            ('X_POSITION','x_position'),
+            ('Y_POSITION','y_position'),
+            ('Z_POSITION','z_position'),
+            ('X_VELOCITY','x_velocity'),
+            ('Y_VELOCITY','y_velocity'),
+            ('Z_VELOCITY','z_velocity'),
+            ('VECTOR_SOURCE','vector_source'),
+            ('LEAP_UTC','leap_utc'),
+            ('LEAP_SIGN','leap_sign'),
+            ('LEAP_ERR','leap_err'),
+            ('PRODUCT_ERR','product_err')]
+        # SPH metadata keys and the global attributes they are read from
+        SPH_attributes = [
+            ('START_RECORD_TAI_TIME','first_record_time'),
+            ('STOP_RECORD_TAI_TIME','last_record_time'),
+            ('ABS_ORBIT_START','abs_orbit_start'),
+            ('REL_TIME_ASC_NODE_START','rel_time_acs_node_start'),
+            ('ABS_ORBIT_STOP','abs_orbit_stop'),
+            ('REL_TIME_ASC_NODE_STOP','rel_time_acs_node_stop'),
+            ('EQUATOR_CROSS_TIME_UTC','equator_cross_time'),
+            ('EQUATOR_CROSS_LONG','equator_cross_long'),
+            ('ASCENDING_FLAG','ascending_flag'),
+            ('START_LAT','first_record_lat'),
+            ('START_LONG','first_record_lon'),
+            ('STOP_LAT','last_record_lat'),
+            ('STOP_LONG','last_record_lon'),
+            ('L1_PROC_FLAG','l1b_proc_flag'),
+            ('L1_PROCESSING_QUALITY','l1b_processing_quality'),
+            ('L1_PROC_THRESH','l1b_proc_thresh'),
+            ('INSTR_ID','instr_id'),
+            ('LRM_MODE_PERCENT','lrm_mode_percent'),
+            ('SAR_MODE_PERCENT','sar_mode_percent'),
+            ('SARIN_MODE_PERCENT','sarin_mode_percent'),
+            ('OPEN_OCEAN_PERCENT','open_ocean_percent'),
+            ('CLOSE_SEA_PERCENT','close_sea_percent'),
+            ('CONTINENT_ICE_PERCENT','continent_ice_percent'),
+            ('LAND_PERCENT','land_percent'),
+            ('L2_PROD_STATUS','l2_prod_status'),
+            ('L2_PROC_FLAG','l2_proc_flag'),
+            ('L2_PROCESSING_QUALITY','l2_processing_quality'),
+            ('L2_PROC_THRESH','l2_proc_thresh'),
+            ('SIR_CONFIGURATION','sir_configuration'),
+            ('SIR_OP_MODE','sir_op_mode'),
+            ('ORBIT_FILE','xref_orbit'),
+            ('PROC_CONFIG_PARAMS_FILE','xref_pconf'),
+            ('CONSTANTS_FILE','xref_constants'),
+            ('IPF_RA_DATABASE_FILE','xref_siral_characterisation'),
+            ('DORIS_USO_DRIFT_FILE','xref_uso'),
+            ('STAR_TRACKER_ATTREF_FILE','xref_star_tracker_attref'),
+            ('SIRAL_LEVEL_0_FILE','xref_siral_l0'),
+            ('CALIBRATION_TYPE_1_FILE','xref_cal1'),
+            ('SIR_COMPLEX_CAL1_SARIN','xref_cal1_sarin'),
+            ('SCENARIO_FILE','xref_orbit_scenario'),
+            ('CALIBRATION_TYPE_2_FILE','xref_cal2'),
+            ('SURFACE_PRESSURE_FILE','xref_surf_pressure'),
+            ('MEAN_PRESSURE_FILE','xref_mean_pressure'),
+            ('WET_TROPOSPHERE_FILE','xref_wet_trop'),
+            ('U_WIND_FILE','xref_u_wind'),
+            ('V_WIND_FILE','xref_v_wind'),
+            ('METEO_GRID_DEF_FILE','xref_meteo'),
+            ('S1S2_PRESSURE_00H_MAP','xref_s1s2_pressure_00h'),
+            ('S1S2_PRESSURE_06H_MAP','xref_s1s2_pressure_06h'),
+            ('S1S2_PRESSURE_12H_MAP','xref_s1s2_pressure_12h'),
+            ('S1S2_PRESSURE_18H_MAP','xref_s1s2_pressure_18h'),
+            ('S1_TIDE_AMPLITUDE_MAP','xref_s1_tide_amplitude'),
+            ('S1_TIDE_PHASE_MAP','xref_s1_tide_phase'),
+            ('S2_TIDE_AMPLITUDE_MAP','xref_s2_tide_amplitude'),
+            ('S2_TIDE_PHASE_MAP','xref_s2_tide_phase'),
+            ('GPS_IONO_MAP','xref_gim'),
+            ('MODIFIED_DIP_MAP_FILE','xref_dip_map'),
+            ('IONO_COEFFICENTS_FILE','xref_iono_cor'),
+            ('SAI_FILE','xref_sai'),
+            ('OCEAN_TIDE_FILE','xref_ocean_tide'),
+            ('TIDAL_LOADING_FILE','xref_tidal_load'),
+            ('EARTH_TIDE_FILE','xref_earth_tide'),
+            ('POLE_TIDE_FILE','xref_pole_location'),
+            ('SURFACE_TYPE_FILE','xref_surf_type'),
+            ('AUX_MOG2D','xref_mog2d'),
+            ('SIRAL_LEVEL_1B_FILE','xref_siral_l1b'),
+            ('MEAN_SEA_SURFACE_FILE','xref_mss'),
+            ('GEOID_FILE','xref_geoid'),
+            ('ODLE_FILE','xref_odle')]
+        # mode dependent SPH attributes
+        SPH_optional = [
+            ('DEM_MODEL_FILE','xref_dem'),
+            ('SEA_ICE_FILE','xref_sea_ice'),
+            ('SNOW_DEPTH_FILE','xref_snow_depth')]
         CS_l2_mds['METADATA'] = dict(MPH={},SPH={},DSD={})
-        # MPH attributes
-        CS_l2_mds['METADATA']['MPH']['PRODUCT'] = fid.product_name
-        CS_l2_mds['METADATA']['MPH']['DOI'] = fid.doi
-        CS_l2_mds['METADATA']['MPH']['PROC_STAGE'] =  fid.processing_stage
-        CS_l2_mds['METADATA']['MPH']['REF_DOC'] =  fid.reference_document
-        CS_l2_mds['METADATA']['MPH']['ACQUISITION_STATION'] = fid.acquisition_station
-        CS_l2_mds['METADATA']['MPH']['PROC_CENTER'] = fid.processing_centre
-        CS_l2_mds['METADATA']['MPH']['PROC_TIME'] = fid.creation_time
-        CS_l2_mds['METADATA']['MPH']['SOFTWARE_VER'] = fid.software_version
-        CS_l2_mds['METADATA']['MPH']['SENSING_START'] = fid.sensing_start
-        CS_l2_mds['METADATA']['MPH']['SENSING_STOP'] = fid.sensing_stop
-        CS_l2_mds['METADATA']['MPH']['PHASE'] = fid.phase
-        CS_l2_mds['METADATA']['MPH']['CYCLE'] = fid.cycle_number
-        CS_l2_mds['METADATA']['MPH']['REL_ORBIT'] = fid.rel_orbit_number
-        CS_l2_mds['METADATA']['MPH']['ABS_ORBIT'] = fid.abs_orbit_number
-        CS_l2_mds['METADATA']['MPH']['STATE_VECTOR_TIME'] = fid.state_vector_time
-        CS_l2_mds['METADATA']['MPH']['DELTA_UT1'] = fid.delta_ut1
-        CS_l2_mds['METADATA']['MPH']['X_POSITION'] = fid.x_position
-        CS_l2_mds['METADATA']['MPH']['Y_POSITION'] = fid.y_position
-        CS_l2_mds['METADATA']['MPH']['Z_POSITION'] = fid.z_position
-        CS_l2_mds['METADATA']['MPH']['X_VELOCITY'] = fid.x_velocity
-        CS_l2_mds['METADATA']['MPH']['Y_VELOCITY'] = fid.y_velocity
-        CS_l2_mds['METADATA']['MPH']['Z_VELOCITY'] = fid.z_velocity
-        CS_l2_mds['METADATA']['MPH']['VECTOR_SOURCE'] = fid.vector_source
-        CS_l2_mds['METADATA']['MPH']['LEAP_UTC'] = fid.leap_utc
-        CS_l2_mds['METADATA']['MPH']['LEAP_SIGN'] = fid.leap_sign
-        CS_l2_mds['METADATA']['MPH']['LEAP_ERR'] = fid.leap_err
-        CS_l2_mds['METADATA']['MPH']['PRODUCT_ERR'] = fid.product_err
-        # SPH attributes
-        CS_l2_mds['METADATA']['SPH']['START_RECORD_TAI_TIME'] = fid.first_record_time
-        CS_l2_mds['METADATA']['SPH']['STOP_RECORD_TAI_TIME'] = fid.last_record_time
-        CS_l2_mds['METADATA']['SPH']['ABS_ORBIT_START'] = fid.abs_orbit_start
-        CS_l2_mds['METADATA']['SPH']['REL_TIME_ASC_NODE_START'] = fid.rel_time_acs_node_start
-        CS_l2_mds['METADATA']['SPH']['ABS_ORBIT_STOP'] = fid.abs_orbit_stop
-        CS_l2_mds['METADATA']['SPH']['REL_TIME_ASC_NODE_STOP'] = fid.rel_time_acs_node_stop
-        CS_l2_mds['METADATA']['SPH']['EQUATOR_CROSS_TIME_UTC'] = fid.equator_cross_time
-        CS_l2_mds['METADATA']['SPH']['EQUATOR_CROSS_LONG'] = fid.equator_cross_long
-        CS_l2_mds['METADATA']['SPH']['ASCENDING_FLAG'] = fid.ascending_flag
-        CS_l2_mds['METADATA']['SPH']['START_LAT'] = fid.first_record_lat
-        CS_l2_mds['METADATA']['SPH']['START_LONG'] = fid.first_record_lon
-        CS_l2_mds['METADATA']['SPH']['STOP_LAT'] = fid.last_record_lat
-        CS_l2_mds['METADATA']['SPH']['STOP_LONG'] = fid.last_record_lon
-        CS_l2_mds['METADATA']['SPH']['L1_PROC_FLAG'] = fid.l1b_proc_flag
-        CS_l2_mds['METADATA']['SPH']['L1_PROCESSING_QUALITY'] = fid.l1b_processing_quality
-        CS_l2_mds['METADATA']['SPH']['L1_PROC_THRESH'] = fid.l1b_proc_thresh
-        CS_l2_mds['METADATA']['SPH']['INSTR_ID'] = fid.instr_id
-        CS_l2_mds['METADATA']['SPH']['LRM_MODE_PERCENT'] = fid.lrm_mode_percent
-        CS_l2_mds['METADATA']['SPH']['SAR_MODE_PERCENT'] = fid.sar_mode_percent
-        CS_l2_mds['METADATA']['SPH']['SARIN_MODE_PERCENT'] = fid.sarin_mode_percent
-        CS_l2_mds['METADATA']['SPH']['OPEN_OCEAN_PERCENT'] = fid.open_ocean_percent
-        CS_l2_mds['METADATA']['SPH']['CLOSE_SEA_PERCENT'] = fid.close_sea_percent
-        CS_l2_mds['METADATA']['SPH']['CONTINENT_ICE_PERCENT'] = fid.continent_ice_percent
-        CS_l2_mds['METADATA']['SPH']['LAND_PERCENT'] = fid.land_percent
-        CS_l2_mds['METADATA']['SPH']['L2_PROD_STATUS'] = fid.l2_prod_status
-        CS_l2_mds['METADATA']['SPH']['L2_PROC_FLAG'] = fid.l2_proc_flag
-        CS_l2_mds['METADATA']['SPH']['L2_PROCESSING_QUALITY'] = fid.l2_processing_quality
-        CS_l2_mds['METADATA']['SPH']['L2_PROC_THRESH'] = fid.l2_proc_thresh
-        CS_l2_mds['METADATA']['SPH']['SIR_CONFIGURATION'] = fid.sir_configuration
-        CS_l2_mds['METADATA']['SPH']['SIR_OP_MODE'] = fid.sir_op_mode
-        CS_l2_mds['METADATA']['SPH']['ORBIT_FILE'] = fid.xref_orbit
-        CS_l2_mds['METADATA']['SPH']['PROC_CONFIG_PARAMS_FILE'] = fid.xref_pconf
-        CS_l2_mds['METADATA']['SPH']['CONSTANTS_FILE'] = fid.xref_constants
-        CS_l2_mds['METADATA']['SPH']['IPF_RA_DATABASE_FILE'] = fid.xref_siral_characterisation
-        CS_l2_mds['METADATA']['SPH']['DORIS_USO_DRIFT_FILE'] = fid.xref_uso
-        CS_l2_mds['METADATA']['SPH']['STAR_TRACKER_ATTREF_FILE'] = fid.xref_star_tracker_attref
-        CS_l2_mds['METADATA']['SPH']['SIRAL_LEVEL_0_FILE'] = fid.xref_siral_l0
-        CS_l2_mds['METADATA']['SPH']['CALIBRATION_TYPE_1_FILE'] = fid.xref_cal1
-        CS_l2_mds['METADATA']['SPH']['SIR_COMPLEX_CAL1_SARIN'] = fid.xref_cal1_sarin
-        CS_l2_mds['METADATA']['SPH']['SCENARIO_FILE'] = fid.xref_orbit_scenario
-        CS_l2_mds['METADATA']['SPH']['CALIBRATION_TYPE_2_FILE'] = fid.xref_cal2
-        CS_l2_mds['METADATA']['SPH']['SURFACE_PRESSURE_FILE'] = fid.xref_surf_pressure
-        CS_l2_mds['METADATA']['SPH']['MEAN_PRESSURE_FILE'] = fid.xref_mean_pressure
-        CS_l2_mds['METADATA']['SPH']['WET_TROPOSPHERE_FILE'] = fid.xref_wet_trop
-        CS_l2_mds['METADATA']['SPH']['U_WIND_FILE'] = fid.xref_u_wind
-        CS_l2_mds['METADATA']['SPH']['V_WIND_FILE'] = fid.xref_v_wind
-        CS_l2_mds['METADATA']['SPH']['METEO_GRID_DEF_FILE'] = fid.xref_meteo
-        CS_l2_mds['METADATA']['SPH']['S1S2_PRESSURE_00H_MAP'] = fid.xref_s1s2_pressure_00h
-        CS_l2_mds['METADATA']['SPH']['S1S2_PRESSURE_06H_MAP'] = fid.xref_s1s2_pressure_06h
-        CS_l2_mds['METADATA']['SPH']['S1S2_PRESSURE_12H_MAP'] = fid.xref_s1s2_pressure_12h
-        CS_l2_mds['METADATA']['SPH']['S1S2_PRESSURE_18H_MAP'] = fid.xref_s1s2_pressure_18h
-        CS_l2_mds['METADATA']['SPH']['S1_TIDE_AMPLITUDE_MAP'] = fid.xref_s1_tide_amplitude
-        CS_l2_mds['METADATA']['SPH']['S1_TIDE_PHASE_MAP'] = fid.xref_s1_tide_phase
-        CS_l2_mds['METADATA']['SPH']['S2_TIDE_AMPLITUDE_MAP'] = fid.xref_s2_tide_amplitude
-        CS_l2_mds['METADATA']['SPH']['S2_TIDE_PHASE_MAP'] = fid.xref_s2_tide_phase
-        CS_l2_mds['METADATA']['SPH']['GPS_IONO_MAP'] = fid.xref_gim
-        CS_l2_mds['METADATA']['SPH']['MODIFIED_DIP_MAP_FILE'] = fid.xref_dip_map
-        CS_l2_mds['METADATA']['SPH']['IONO_COEFFICENTS_FILE'] = fid.xref_iono_cor
-        CS_l2_mds['METADATA']['SPH']['SAI_FILE'] = fid.xref_sai
-        CS_l2_mds['METADATA']['SPH']['OCEAN_TIDE_FILE'] = fid.xref_ocean_tide
-        CS_l2_mds['METADATA']['SPH']['TIDAL_LOADING_FILE'] = fid.xref_tidal_load
-        CS_l2_mds['METADATA']['SPH']['EARTH_TIDE_FILE'] = fid.xref_earth_tide
-        CS_l2_mds['METADATA']['SPH']['POLE_TIDE_FILE'] = fid.xref_pole_location
-        CS_l2_mds['METADATA']['SPH']['SURFACE_TYPE_FILE'] = fid.xref_surf_type
-        CS_l2_mds['METADATA']['SPH']['AUX_MOG2D'] = fid.xref_mog2d
-        CS_l2_mds['METADATA']['SPH']['SIRAL_LEVEL_1B_FILE'] = fid.xref_siral_l1b
-        CS_l2_mds['METADATA']['SPH']['MEAN_SEA_SURFACE_FILE'] = fid.xref_mss
-        CS_l2_mds['METADATA']['SPH']['GEOID_FILE'] = fid.xref_geoid
-        CS_l2_mds['METADATA']['SPH']['ODLE_FILE'] = fid.xref_odle
-        # mode dependent attributes
-        if ('xref_dem' in fid.ncattrs()):
-            CS_l2_mds['METADATA']['SPH']['DEM_MODEL_FILE'] = fid.xref_dem
-        if ('xref_sea_ice' in fid.ncattrs()):
-            CS_l2_mds['METADATA']['SPH']['SEA_ICE_FILE'] = fid.xref_sea_ice
-        if ('xref_snow_depth' in fid.ncattrs()):
-            CS_l2_mds['METADATA']['SPH']['SNOW_DEPTH_FILE'] = fid.xref_snow_depth
+        for key,att in MPH_attributes:
+            CS_l2_mds['METADATA']['MPH'][key] = attributes[att]
+        for key,att in SPH_attributes:
+            CS_l2_mds['METADATA']['SPH'][key] = attributes[att]
+        for key,att in SPH_optional:
+            if att in attributes:
+                CS_l2_mds['METADATA']['SPH'][key] = attributes[att]
 
         # close the netCDF4 file
         fid.close()
@@ -1438,3 +1192,13 @@ class data(pc.data):
 
         # return the scaling factors
         return CS_l2_scale
+
+def _read_file(full_filename, field_dict, unpack):
+    """
+    Read a single CryoSat Level-2 file within a worker process
+    """
+    D = data(field_dict=field_dict)
+    if (os.path.splitext(full_filename)[1] == '.nc'):
+        return D.from_nc(full_filename, field_dict=field_dict, unpack=unpack)
+    else:
+        return D.from_dbl(full_filename, field_dict=field_dict, unpack=unpack)
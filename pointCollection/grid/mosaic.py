@@ -6,6 +6,8 @@ Routines for creating a weighted mosaic from a series of tiles
 Written by Tyler Sutterley (03/2020)
 
 UPDATE HISTORY:
+    Updated 10/2026: apply separable weights by broadcasting (fixes non-square tiles)
+    Updated 10/2026: round tile coordinates to the nearest mosaic node
     updated 03/2021: change scheme for calculating weights, raised cosine as default
     Updated 03/2020: check number of dimensions of z if only a single band
     Written 03/2020
@@ -43,14 +45,11 @@ class mosaic(data):
         """
         update the bounds of mosaic
         """
-        if (temp.extent[0] < self.extent[0]):
-            self.extent[0] = np.copy(temp.extent[0])
-        if (temp.extent[1] > self.extent[1]):
-            self.extent[1] = np.copy(temp.extent[1])
-        if (temp.extent[2] < self.extent[2]):
-            self.extent[2] = np.copy(temp.extent[2])
-        if (temp.extent[3] > self.extent[3]):
-            self.extent[3] = np.copy(temp.extent[3])
+        extent, tile_extent = self.extent, temp.extent
+        extent[0] = min(extent[0], tile_extent[0])
+        extent[1] = max(extent[1], tile_extent[1])
+        extent[2] = min(extent[2], tile_extent[2])
+        extent[3] = max(extent[3], tile_extent[3])
         return self
 
     def update_dimensions(self, temp):
@@ -58,15 +57,16 @@ class mosaic(data):
         update the dimensions of the mosaic with new extents
         """
         # get number of bands
-        if hasattr(temp,'t') and hasattr(temp.t, 'size') and temp.t.size > 0:
-            self.dimensions[2]=temp.t.size
-            self.t=temp.t.copy()
+        t = getattr(temp, 't', None)
+        if getattr(t, 'size', 0) > 0:
+            self.dimensions[2]=t.size
+            self.t=t.copy()
         else:
             self.dimensions[2] = 1
         # calculate y dimensions with new extents
-        self.dimensions[0] = np.int64((self.extent[3] - self.extent[2])/self.spacing[1]) + 1
+        self.dimensions[0] = int(np.rint((self.extent[3] - self.extent[2])/self.spacing[1])) + 1
         # calculate x dimensions with new extents
-        self.dimensions[1] = np.int64((self.extent[1] - self.extent[0])/self.spacing[0]) + 1
+        self.dimensions[1] = int(np.rint((self.extent[1] - self.extent[0])/self.spacing[0])) + 1
         # calculate x and y arrays
         self.x = np.linspace(self.extent[0],self.extent[1],self.dimensions[1])
         self.y = np.linspace(self.extent[2],self.extent[3],self.dimensions[0])
@@ -76,9 +76,12 @@ class mosaic(data):
         """
         get the image coordinates
         """
-        iy = np.array((temp.y[:,None]-self.extent[2])/self.spacing[1],dtype=np.int64)
-        ix = np.array((temp.x[None,:]-self.extent[0])/self.spacing[0],dtype=np.int64)
-        return (iy,ix)
+        # round to the nearest mosaic node so that floating point error in
+        # the tile coordinates cannot shift a row or column down by one
+        iy = np.rint((temp.y-self.extent[2])/self.spacing[1]).astype(np.intp)
+        ix = np.rint((temp.x-self.extent[0])/self.spacing[0]).astype(np.intp)
+        # return as a column and a row so that [iy,ix] indexes the tile block
+        return (iy[:,None],ix[None,:])
 
     def raised_cosine_weights(self, pad, feather):
 
@@ -94,7 +97,7 @@ class mosaic(data):
             wt[ dist <= W/2 - pad - feather ] = 1
             wt[ dist >= W/2 - pad] = 0
             weights += [wt]
-        self.weight *= weights[0][:,None].dot(weights[1][None,:])
+        self.apply_separable_weights(*weights)
 
     def gaussian_weights(self, pad, feather):
         # use a gaussian filter to create smoothed weighting function
@@ -110,7 +113,7 @@ class mosaic(data):
             wt[ dist <= W/2 - pad - feather ] = 1
             wt[ dist >= W/2 - pad] = 0
             weights += [wt]
-        self.weight *= weights[0][:,None].dot(weights[1][None,:])
+        self.apply_separable_weights(*weights)
 
     def pad_edges(self, pad):
         weights=[]
@@ -121,7 +124,15 @@ class mosaic(data):
             wt=np.ones_like(dist)
             wt[ dist >= W/2 - pad] = 0
             weights += [wt]
-        self.weight *= weights[0][:,None].dot(weights[1][None,:])
+        self.apply_separable_weights(*weights)
+
+    def apply_separable_weights(self, wt_x, wt_y):
+        """
+        multiply the weight matrix by 1-D weights along x and y
+        """
+        # broadcast the 1-D weights rather than forming their outer product
+        self.weight *= wt_y[:,None]
+        self.weight *= wt_x[None,:]
 
     def weights(self, pad=0, feather=0, apply=False, mode='raised cosine'):
         """
@@ -129,14 +140,12 @@ class mosaic(data):
         Apply the weights if specified
         """
         # find dimensions of matrix
-        sh = getattr(self, self.fields[0]).shape
-        if len(sh)==3:
-            ny, nx, nband = sh
-        else:
-            nband =1
-            ny, nx = sh
+        ny, nx = getattr(self, self.fields[0]).shape[0:2]
         # allocate for weights matrix
         self.weight = np.ones((ny,nx), dtype=float)
+        # uniform weights: nothing to taper, and applying them is a no-op
+        if not pad and not feather:
+            return self
         # feathering the weight matrix
         if feather:
             if mode == 'raised cosine':
@@ -148,9 +157,10 @@ class mosaic(data):
         # if applying the weights to the original z data
         if apply:
             for field in self.fields:
-                if nband > 1:
-                    for band in range(nband):
-                        getattr(self, field)[:,:,band] *= self.weight
+                val = getattr(self, field)
+                # broadcast the weights over all bands of 3-D fields
+                if val.ndim == 3:
+                    val *= self.weight[:,:,None]
                 else:
-                    getattr(self, field)[:,:] *= self.weight
+                    val *= self.weight
         return self
@@ -13,48 +13,74 @@ import os
 import h5py
 #import matplotlib.pyplot as plt
 import glob
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
 #import re
 #import sys
 
-def ATL06_crossovers(files, different_cycles=False, delta_time_max=np.inf, n_extra_segments=0):
+def read_ATL06_tracks(file, fields):
+    return pc.reconstruct_ATL06_tracks(\
+            pc.indexedH5.data(filename=file).read(None, fields=fields ))
+
+def ATL06_crossovers(files, different_cycles=False, delta_time_max=np.inf, n_extra_segments=0, n_workers=None):
     D=[]
     with h5py.File(files[0],'r') as h5f:
         fields=list(h5f[list(h5f.keys())[0]].keys())
 
-    for file in files:
-        D += pc.reconstruct_ATL06_tracks(\
-            pc.indexedH5.data(filename=file).read(None, fields=fields ))
+    if n_workers is not None and n_workers > 1 and len(files) > 1:
+        # read the files in separate processes
+        with ProcessPoolExecutor(max_workers=min(n_workers, len(files))) as executor:
+            for tracks in executor.map(read_ATL06_tracks, files, repeat(fields)):
+                D += tracks
+    else:
+        for file in files:
+            D += read_ATL06_tracks(file, fields)
     for Di in D:
         # set the along-track dh filter to calculate the differences, but not to edit the data
         along_track_dh_filter(Di, threshold=None,  to_nan=False)
         Di.assign({'time':Di.delta_time})
         Di.index(np.isfinite(Di.h_li))
     xover_list=list()
+    delta_coarse=1000
+    # per-track summaries used to screen out pairs that cannot cross:
+    # cross_tracks only matches points that fall in the same delta_coarse
+    # bin, so tracks whose bounding boxes are further apart than that never cross
+    n_pts=np.array([Di.size for Di in D])
+    track_info=np.array([[Di.delta_time[0], Di.rgt[0], Di.cycle_number[0],
+            np.nanmin(Di.x), np.nanmax(Di.x), np.nanmin(Di.y), np.nanmax(Di.y)]
+        if Di.size > 0 else [np.nan]*7 for Di in D]).reshape(-1, 7)
+    t0, rgt, cycle, xmin, xmax, ymin, ymax = track_info.T
     #plt.clf()
-    for ii in np.arange(len(D)):
-        for jj in np.arange(len(D)):
-            if np.abs(D[ii].delta_time[0] - D[jj].delta_time[0]) > delta_time_max:
-                continue
-            if (D[ii].size <2) or (D[jj].size < 2) or (ii>=jj) or (D[ii].rgt[0]==D[jj].rgt[0]):
-                continue
-            if different_cycles and D[ii].cycle_number[0]==D[jj].cycle_number[0]:
-                continue
-            xyC, inds, L=pc.cross_tracks([D[ii], D[jj]], delta=20, delta_coarse=1000)
+    n_D=len(D)
+    for ii in range(n_D):
+        if n_pts[ii] < 2:
+            continue
+        Di=D[ii]
+        others=np.arange(ii+1, n_D)
+        keep = (n_pts[others] >= 2) & (rgt[others] != rgt[ii]) & \
+            (np.abs(t0[others] - t0[ii]) <= delta_time_max) & \
+            (xmin[others] <= xmax[ii]+delta_coarse) & (xmax[others] >= xmin[ii]-delta_coarse) & \
+            (ymin[others] <= ymax[ii]+delta_coarse) & (ymax[others] >= ymin[ii]-delta_coarse)
+        if different_cycles:
+            keep &= cycle[others] != cycle[ii]
+        for jj in others[keep]:
+            Dj=D[jj]
+            xyC, inds, L=pc.cross_tracks([Di, Dj], delta=20, delta_coarse=delta_coarse)
             if xyC is not None:
                 try:
-                    xover_list.append({'xyC':xyC, 'data_0':D[ii][inds[0]], 'data_1':D[jj][inds[1]], 'L0':L[0], 'L1':L[1]})
+                    xover_list.append({'xyC':xyC, 'data_0':Di[inds[0]], 'data_1':Dj[inds[1]], 'L0':L[0], 'L1':L[1]})
                     if n_extra_segments > 0:
                         xover_list[-1]['data_0_extra_segments'] = list()
                         xover_list[-1]['data_1_extra_segments'] = list()
-                        for kk in np.concatenate([np.arange(inds[0][0]-n_extra_segments, inds[0][0]), np.arange(inds[0][1]+1, inds[0][1]+n_extra_segments+1)]):
-                            if kk >= 0 and kk < D[ii].shape[0]:
-                                xover_list[-1]['data_0_extra_segments'].append(D[ii][kk])
+                        for kk in [*range(inds[0][0]-n_extra_segments, inds[0][0]), *range(inds[0][1]+1, inds[0][1]+n_extra_segments+1)]:
+                            if kk >= 0 and kk < Di.shape[0]:
+                                xover_list[-1]['data_0_extra_segments'].append(Di[kk])
                             else:
                                 xover_list[-1]['data_0_extra_segments'].append(pc.data())
 
-                        for kk in np.concatenate([np.arange(inds[1][0]-n_extra_segments, inds[1][0]), np.arange(inds[1][1]+1, inds[1][1]+n_extra_segments+1)]):
-                            if kk >= 0 and kk < D[jj].shape[0]:
-                                xover_list[-1]['data_1_extra_segments'].append(D[jj][kk])
+                        for kk in [*range(inds[1][0]-n_extra_segments, inds[1][0]), *range(inds[1][1]+1, inds[1][1]+n_extra_segments+1)]:
+                            if kk >= 0 and kk < Dj.shape[0]:
+                                xover_list[-1]['data_1_extra_segments'].append(Dj[kk])
                             else:
                                 xover_list[-1]['data_1_extra_segments'].append(pc.data())
                         xover_list[-1]['data_0_extra_segments'] = pc.data().from_list(xover_list[-1]['data_0_extra_segments'])
@@ -65,62 +91,79 @@ def ATL06_crossovers(files, different_cycles=False, delta_time_max=np.inf, n_ext
 
 
 def write_xovers(xover_list, out_file, n_extra_segments=0):
-    if os.path.isfile(out_file):
-        os.remove(out_file)
-    with h5py.File(out_file,'w') as h5f:
-        for key_D in ['data_0', 'data_1']:
-            group='/'+key_D
-            h5f.create_group(group)
-
-            key_L=key_D.replace('data_','L')
-            L=np.c_[[item[key_L] for item in xover_list]]
-
+    n_xovers=len(xover_list)
+    # assemble every output dataset before opening the file
+    datasets={}
+    for key_D in ['data_0', 'data_1']:
+        key_L=key_D.replace('data_','L')
+        L=np.fromiter((item[key_L] for item in xover_list), dtype=float, count=n_xovers)
+
+        Dtemp=[item[key_D] for item in xover_list]
+        Dtemp=pc.data().from_list(Dtemp)
+        shape=[Dtemp.size//2, 2]
+        Dtemp.shape=shape
+        for key in Dtemp.fields:
+            temp=getattr(Dtemp, key)
+            temp.shape=shape
+            datasets[key_D+'/'+key]=temp
+        W=np.empty((n_xovers, 2))
+        W[:,0]=1-L
+        W[:,1]=L
+        datasets[key_D+'/W']=W
+
+    if n_extra_segments > 0:
+        for key_D in ['data_0_extra_segments', 'data_1_extra_segments']:
             Dtemp=[item[key_D] for item in xover_list]
             Dtemp=pc.data().from_list(Dtemp)
-            shape=[np.int64(Dtemp.size/2), 2]
+            shape=[Dtemp.size//(n_extra_segments*2), n_extra_segments*2]
             Dtemp.shape=shape
             for key in Dtemp.fields:
                 temp=getattr(Dtemp, key)
                 temp.shape=shape
-                h5f.create_dataset(group+'/'+key, data=temp)
-            h5f.create_dataset(group+'/W', data=np.c_[1-L, L])
-
-        if n_extra_segments > 0:
-            for key_D in ['data_0_extra_segments', 'data_1_extra_segments']:
-                group='/'+key_D
-                h5f.create_group(group)
-
-                Dtemp=[item[key_D] for item in xover_list]
-                Dtemp=pc.data().from_list(Dtemp)
-                shape=[np.int64(Dtemp.size/(n_extra_segments*2)), n_extra_segments*2]
-                Dtemp.shape=shape
-                for key in Dtemp.fields:
-                    temp=getattr(Dtemp, key)
-                    temp.shape=shape
-                    h5f.create_dataset(group+'/'+key, data=temp)
-
-        xy=np.c_[[item['xyC'] for item in xover_list]]
-        h5f.create_dataset('/x', data=xy[:,0])
-        h5f.create_dataset('/y', data=xy[:,1])
-        try:
-            h5f.create_dataset('/slope_x', data=np.array([item['slope_x'] for item in xover_list]))
-            h5f.create_dataset('/slope_y', data=np.array([item['slope_y'] for item in xover_list]))
-            h5f.create_dataset('/masked', data=np.array([item['masked'] for item in xover_list]))
-        except Exception as e:
-            print("# write_xovers: caught exception:" + str(e.__class__) + ' '+str(e))
+                datasets[key_D+'/'+key]=temp
+
+    xy=np.empty((n_xovers, 2))
+    for ii, item in enumerate(xover_list):
+        xy[ii]=np.ravel(item['xyC'])
+    datasets['x']=xy[:,0]
+    datasets['y']=xy[:,1]
+    try:
+        for key, dtype in [('slope_x', float), ('slope_y', float), ('masked', bool)]:
+            datasets[key]=np.fromiter((item[key] for item in xover_list), dtype=dtype, count=n_xovers)
+    except Exception as e:
+        print("# write_xovers: caught exception:" + str(e.__class__) + ' '+str(e))
+
+    if os.path.isfile(out_file):
+        os.remove(out_file)
+    # write in a single pass, creating the groups from the dataset paths.
+    # Datasets are chunked along the crossover dimension and compressed,
+    # as in pc.data.to_h5
+    with h5py.File(out_file,'w') as h5f:
+        for name, data in datasets.items():
+            chunks=(min(1024, max(data.shape[0], 1)),)+data.shape[1:]
+            h5f.create_dataset(name, data=data, chunks=chunks, compression='gzip')
     return #xover_list
 
-def read_xovers(xover_dir):
+def read_xover_tile(tile, fields):
+    # open the tile once for both crossover groups and the crossover locations
+    with h5py.File(tile,'r') as h5f:
+        D=[pc.data().from_dict({field:h5f[gr][field][()] for field in fields if field in h5f[gr]},
+                               fields=list(fields)) for gr in ['data_0','data_1']]
+        X=pc.data().from_dict({field:h5f[field][()] for field in ['x','y']})
+    for Di in D+[X]:
+        Di.filename=tile
+    return D, X
+
+def read_xovers(xover_dir, n_workers=None):
 
     tiles=glob.glob(xover_dir+'/*.h5')
     with h5py.File(tiles[0],'r') as h5f:
-        fields=[key for key in h5f['D0'].keys()]
-    D=[]
-    X=[]
-    for tile in glob.glob(xover_dir+'/*.h5'):
-        D.append([pc.data().from_file(tile, field_dict={gr : fields}) for gr in ['D0','D1']])
-        with h5py.open(tile,'r') as h5f:
-            X.append(pc.data(fields=['x','y']).from_file(tile,field_dict={None:['x','y']}))
+        fields=[key for key in h5f['data_0'].keys()]
+    # tiles are independent files, so read them in separate processes
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        results=list(executor.map(read_xover_tile, tiles, repeat(fields), chunksize=8))
+    D=[result[0] for result in results]
+    X=[result[1] for result in results]
     return D, X
 
 def make_queue(files, args):
@@ -158,17 +201,18 @@ def calc_slope(xovers, mask_file, mask_value=1, hemisphere=-1):
         print(f"\cross_ATL06_tile.py: no data found in mask file {mask_file}, marking all crossovers as masked\n")
         masked=np.zeros(xy.shape[0], dtype=bool)
 
-    G=np.zeros((4,4))
-    G[:,2]=np.array([1, 1, 0, 0])
-    G[:,3]=np.array([0, 0, 1, 1])
+    # stack the 4x4 systems for all crossovers and solve them in one call
+    x1, y1, h1 = [np.array([np.r_[getattr(xo['data_0'], field), getattr(xo['data_1'], field)] \
+                           for xo in xovers]) for field in ['x', 'y', 'h_li']]
+    G=np.zeros((len(xovers),4,4))
+    G[:,:,0]=x1-x1.mean(axis=1)[:,None]
+    G[:,:,1]=y1-y1.mean(axis=1)[:,None]
+    G[:,:,2]=np.array([1, 1, 0, 0])
+    G[:,:,3]=np.array([0, 0, 1, 1])
+    m=np.linalg.solve(G, h1[:,:,None])[:,:,0]
     for ii, xo in enumerate(xovers):
-        x1=np.r_[xo['data_0'].x, xo['data_1'].x]
-        y1=np.r_[xo['data_0'].y, xo['data_1'].y]
-        G[:,0]=x1-x1.mean()
-        G[:,1]=y1-y1.mean()
-        m=np.linalg.solve(G, np.r_[xo['data_0'].h_li, xo['data_1'].h_li])
-        xo['slope_x'] = m[0]
-        xo['slope_y'] = m[1]
+        xo['slope_x'] = m[ii,0]
+        xo['slope_y'] = m[ii,1]
         xo['masked'] = masked[ii]
 
 def along_track_dh_filter(D, threshold=None, to_nan=False):
@@ -178,18 +222,20 @@ def along_track_dh_filter(D, threshold=None, to_nan=False):
         D.assign({'rss_along_track_dh': ss_dh})
         return
     i0=slice(1, n_pts-1)
-    for ii in [-1, 1]:
-        i1=slice(1+ii, n_pts-1+ii)
-        dx=D.x_atc[i0]-D.x_atc[i1]
-        ss_dh[i0] += (D.h_li[i0]-D.dh_fit_dx[i0]*dx-D.h_li[i1])**2
+    # residuals against the previous and the next segment, in one expression
+    dx_b=D.x_atc[i0]-D.x_atc[:-2]
+    dx_f=D.x_atc[i0]-D.x_atc[2:]
+    ss_dh[i0]=(D.h_li[i0]-D.dh_fit_dx[i0]*dx_b-D.h_li[:-2])**2 \
+        + (D.h_li[i0]-D.dh_fit_dx[i0]*dx_f-D.h_li[2:])**2
     ss_dh[0]=(D.h_li[1]-D.h_li[0] - (D.x_atc[1]-D.x_atc[0])*D.dh_fit_dx[0])**2
     ss_dh[-1]=(D.h_li[-1]-D.h_li[-2] - (D.x_atc[-1]-D.x_atc[-2])*D.dh_fit_dx[-1])**2
     rss_dh = np.sqrt(ss_dh)
     D.assign({'rss_along_track_dh': rss_dh})
     if threshold is not None:
-        D.valid[rss_dh>threshold]=0
-    if to_nan:
-        D.h_li[rss_dh>threshold]=np.NaN
+        bad=rss_dh>threshold
+        D.valid[bad]=0
+        if to_nan:
+            D.h_li[bad]=np.nan
 
 
 def main():
@@ -203,6 +249,7 @@ def main():
     parser.add_argument('--different_cycles_only','-d', action='store_true', help="Calculate crossovers only for tracks from different cycles")
     parser.add_argument('--delta_time_max','-dtm', type=float, help="Maximum delta time between crossover measurements", default=np.inf)
     parser.add_argument('--n_extra_segments','-n', type=int, help="Number of extra ATL06 segments to include on either side of crossover", default=0)
+    parser.add_argument('--n_workers','-j', type=int, help="Number of processes used to read the input tiles", default=None)
     parser.add_argument('--queue','-q', action="store_true")
     args=parser.parse_args()
 
@@ -218,7 +265,7 @@ def main():
         make_queue(files, args)
         return
 
-    xover_list = ATL06_crossovers(files, different_cycles=args.different_cycles_only, delta_time_max=args.delta_time_max, n_extra_segments=args.n_extra_segments)
+    xover_list = ATL06_crossovers(files, different_cycles=args.different_cycles_only, delta_time_max=args.delta_time_max, n_extra_segments=args.n_extra_segments, n_workers=args.n_workers)
     if len(xover_list) > 0:
         if args.hemisphere is not None:
             calc_slope(xover_list, args.mask_file, mask_value=args.mask_value, hemisphere=args.hemisphere)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for reading CryoSat-2 Level-2 files from synthetic data
+"""
+import pytest
+import netCDF4
+import numpy as np
+import pointCollection as pc
+
+# binary record layouts of the CryoSat-2 Level-2 products (big-endian)
+_DBL_1HZ = {
+    'B':[('Day','>i4'),('Second','>i4'),('Micsec','>i4'),('Siral_mode','>u8'),
+        ('Lat_1Hz','>i4'),('Lon_1Hz','>i4'),('Alt_1Hz','>i4'),
+        ('Mispointing','>i2'),('N_valid','>i2')],
+    'C':[('Day','>i4'),('Second','>i4'),('Micsec','>i4'),('Siral_mode','>u8'),
+        ('Lat_1Hz','>i4'),('Lon_1Hz','>i4'),('Alt_1Hz','>i4'),
+        ('Roll','>i4'),('Pitch','>i4'),('Yaw','>i4'),('Spare','>i2'),('N_valid','>i2')]}
+_DBL_CORRECTIONS = [(key,'>i2') for key in ['dryTrop','wetTrop','InvBar','DAC',
+    'Iono','SSB','ocTideElv','lpeTideElv','olTideElv','seTideElv','gpTideElv','Spare1']] + \
+    [('Surf_type','>u8'),('MSS_Geoid','>i4'),('ODLE','>i4'),('Ice_conc','>i2'),
+    ('Snow_depth','>i2'),('Snow_density','>i2'),('Spare2','>i2'),('C_status','>u4'),
+    ('SWH','>i2'),('Wind_speed','>u2'),('Spare3','>i2'),('Spare4','>i2'),
+    ('Spare5','>i2'),('Spare6','>i2')]
+_DBL_20HZ = {
+    'B':[('D_time_mics','>i4'),('Lat','>i4'),('Lon','>i4'),('Elev','>i4'),
+        ('SSHA_interp','>i2'),('SSHA_interp_count','>i2'),('SSHA_interp_RMS','>i2'),
+        ('Sig0','>i2'),('Peakiness','>u2'),('Freeboard','>i2'),('N_avg','>i2'),
+        ('Spare1','>i2'),('Quality_flag','>u4'),('Spare2','>i2'),('Spare3','>i2'),
+        ('Spare4','>i2'),('Spare5','>i2')],
+    'C':[('D_time_mics','>i4'),('Lat','>i4'),('Lon','>i4'),('Elev_1','>i4'),
+        ('Elev_2','>i4'),('Elev_3','>i4'),('Sig0_1','>i2'),('Sig0_2','>i2'),
+        ('Sig0_3','>i2'),('Freeboard','>i2'),('SSHA_interp','>i2'),
+        ('SSHA_interp_count','>i2'),('SSHA_interp_RMS','>i2'),('Peakiness','>u2'),
+        ('N_avg','>i2'),('Spare1','>i2'),('Quality_flag','>u4'),
+        ('Corrections_flag','>u4'),('Quality_1','>i4'),('Quality_2','>i4'),
+        ('Quality_3','>i4')]}
+# number of valid 20Hz measurements in each synthetic record
+_N_VALID = np.array([20, 7, 0, 20, 13])
+# fields read from the synthetic binary files
+_DBL_FIELDS = {'Data_1Hz':['Day','Second','Micsec','Lat_1Hz','N_valid'],
+    'Corrections':['dryTrop'],
+    'Data_20Hz':['days_J2k','D_time_mics','Lat','Lon']}
+
+def _dbl_filename(tmp_path, baseline, header=True):
+    # file names carry the baseline identifier
+    suffix = '' if header else '_noheader'
+    return str(tmp_path / ('CS_OFFL_SIR_SIN_2__20150121T000000_'
+        f'20150121T001000_{baseline}001{suffix}.DBL'))
+
+def _write_dbl(filename, baseline, header=True):
+    """
+    Write a synthetic CryoSat-2 Level-2 binary file with known values
+    """
+    n_records = len(_N_VALID)
+    dtype = np.dtype([('Data_1Hz',_DBL_1HZ[baseline]),
+        ('Corrections',_DBL_CORRECTIONS),
+        ('Data_20Hz',_DBL_20HZ[baseline],(20,))])
+    rec = np.zeros(n_records, dtype=dtype)
+    rec_index = np.arange(n_records)
+    rec['Data_1Hz']['Day'] = 5500
+    rec['Data_1Hz']['Second'] = 3600*rec_index
+    rec['Data_1Hz']['Micsec'] = 1000*rec_index
+    rec['Data_1Hz']['Lat_1Hz'] = 10*rec_index
+    rec['Data_1Hz']['N_valid'] = _N_VALID
+    rec['Corrections']['dryTrop'] = -rec_index
+    # 20Hz values encode their record and block
+    block = 100*rec_index[:,None] + np.arange(20)
+    rec['Data_20Hz']['D_time_mics'] = 50000*np.arange(20)
+    rec['Data_20Hz']['Lat'] = block
+    rec['Data_20Hz']['Lon'] = -block
+    records = rec.tobytes()
+    with open(filename, 'wb') as fid:
+        if header:
+            fid.write(_pds_header(n_records, dtype.itemsize))
+        fid.write(records)
+
+def _pds_header(n_records, record_size):
+    """
+    Build a PDS Main and Specific Product Header with a Level-2 DSD
+    """
+    n_MPH_bytes = 1247
+    def sph_lines(ds_offset):
+        lines = [b'SPH_DESCRIPTOR="L2 SIR_SIN    SPH         "',
+            b'START_RECORD_TAI_TIME="21-JAN-2015 00:00:00.000000"',
+            b'ASCENDING_FLAG="A"']
+        for ds_name in [b'SIR_SIN_L2     ', b'AUX_ORBIT      ']:
+            lines += [b'DS_NAME="' + ds_name + b'"', b'DS_TYPE=M',
+                b'FILENAME="' + b' '*62 + b'"',
+                b'DS_OFFSET=+%021d<bytes>' % ds_offset,
+                b'DS_SIZE=+%021d<bytes>' % (n_records*record_size),
+                b'NUM_DSR=+%010d' % n_records,
+                b'DSR_SIZE=+%010d<bytes>' % record_size, b' '*32]
+        return b'\n'.join(lines) + b'\n'
+    # fixed width fields so the size is known before the offset
+    j_sph_size = len(sph_lines(0))
+    SPH = sph_lines(n_MPH_bytes + j_sph_size)
+    # 41 lines in the MPH with a trailing blank line
+    mph_lines = [b'PRODUCT="CS_OFFL_SIR_SIN_2__20150121T000000_20150121T001000_C001"',
+        b'PROC_STAGE=O', b'ABS_ORBIT=+12345', b'SPH_SIZE=+%010d<bytes>' % j_sph_size]
+    mph_lines += [b'SPARE_%02d="%02d"' % (i,i) for i in range(len(mph_lines), 41)]
+    MPH = b'\n'.join(mph_lines).ljust(n_MPH_bytes - 2) + b'\n\n'
+    return MPH + SPH
+
+@pytest.mark.parametrize("baseline", ['B','C'])
+@pytest.mark.parametrize("header", [True, False])
+def test_read_CS2_dbl(tmp_path, baseline, header):
+    filename = _dbl_filename(tmp_path, baseline, header=header)
+    _write_dbl(filename, baseline, header=header)
+    field_dict = {group:list(fields) for group,fields in _DBL_FIELDS.items()}
+    if header:
+        field_dict['Data_1Hz'] += ['Abs_Orbit','Ascending_flag']
+        field_dict['METADATA'] = ['MPH','SPH','DSD']
+    D = pc.CS2.data().from_dbl(filename, field_dict=field_dict)
+    n_records = len(_N_VALID)
+    rec_index = np.arange(n_records)
+    # 1Hz and correction fields
+    assert np.array_equal(D.Day, np.full(n_records, 5500))
+    assert np.array_equal(D.Second, 3600*rec_index)
+    assert np.array_equal(D.Micsec, 1000*rec_index)
+    assert np.array_equal(D.Lat_1Hz, 10*rec_index)
+    assert np.array_equal(D.N_valid, _N_VALID)
+    assert np.array_equal(D.dryTrop, -rec_index)
+    # 20Hz fields are masked beyond the number of valid measurements
+    mask = np.arange(20) >= _N_VALID[:,None]
+    block = 100*rec_index[:,None] + np.arange(20)
+    for field, expected in [('Lat',block), ('Lon',-block),
+        ('D_time_mics',np.broadcast_to(50000*np.arange(20),(n_records,20)))]:
+        val = getattr(D, field)
+        assert isinstance(val, np.ma.MaskedArray)
+        assert val.shape == (n_records,20)
+        assert np.array_equal(np.ma.getmaskarray(val), mask)
+        assert np.array_equal(val.data[~mask], expected[~mask])
+    # TAI days since 2000 converted to UTC (35 seconds behind TAI in 2015)
+    t = D.Second[:,None] + (D.Micsec[:,None] + 50000*np.arange(20))/1e6 - 35.0
+    days_J2k = D.Day[:,None] + t/86400.0
+    assert np.array_equal(np.ma.getmaskarray(D.days_J2k), mask)
+    assert np.allclose(D.days_J2k.data[~mask], days_J2k[~mask], rtol=0, atol=1e-9)
+    # header metadata
+    if header:
+        assert D.MPH['PRODUCT'] == 'CS_OFFL_SIR_SIN_2__20150121T000000_20150121T001000_C001'
+        assert D.MPH['ABS_ORBIT'] == '+12345'
+        assert D.SPH['ASCENDING_FLAG'] == 'A'
+        assert D.SPH['START_RECORD_TAI_TIME'] == '21-JAN-2015 00:00:00.000000'
+        assert D.SPH['AUX_ORBIT']['DS_TYPE'] == 'M'
+        assert D.DSD['DS_NAME'] == 'SIR_SIN_L2'
+        assert D.DSD['NUM_DSR'] == '+{0:010d}'.format(n_records)
+        assert D.DSD['DSR_SIZE'] == '+{0:010d}<bytes>'.format(
+            1392 if (baseline == 'C') else 980)
+        assert np.array_equal(D.Abs_Orbit, np.full(n_records, 12345))
+        assert np.all(D.Ascending_flag)
+
+def test_read_CS2_dbl_unpack(tmp_path):
+    filename = _dbl_filename(tmp_path, 'C')
+    _write_dbl(filename, 'C')
+    D = pc.CS2.data().from_dbl(filename, field_dict=_DBL_FIELDS, unpack=True)
+    rec_index = np.arange(len(_N_VALID))
+    # scaled fields are converted to physical units in double precision
+    assert D.Lat_1Hz.dtype == np.float64
+    assert np.allclose(D.Lat_1Hz, 1e-6*rec_index)
+    assert D.dryTrop.dtype == np.float64
+    assert np.allclose(D.dryTrop, -1e-3*rec_index)
+    assert D.Lat.dtype == np.float64
+    assert np.allclose(D.Lat[:,0], 1e-5*rec_index)
+    # fields without a scale factor keep their integer types
+    for field in ['Day','Second','Micsec','D_time_mics']:
+        assert getattr(D, field).dtype == np.int32
+    assert D.N_valid.dtype == np.int16
+    assert D.days_J2k.dtype == np.float64
+
+def test_read_CS2_files(tmp_path):
+    filenames = [_dbl_filename(tmp_path, 'C', header=header) for header in [True, False]]
+    for filename, header in zip(filenames, [True, False]):
+        _write_dbl(filename, 'C', header=header)
+    D = pc.CS2.data.from_files(filenames, field_dict=_DBL_FIELDS, n_workers=2)
+    D_list = [pc.CS2.data().from_dbl(filename, field_dict=_DBL_FIELDS)
+        for filename in filenames]
+    n_records = len(_N_VALID)
+    assert isinstance(D, pc.CS2.data)
+    assert D.shape == (2*n_records,)
+    for field in D.fields:
+        val = getattr(D, field)
+        expected = [getattr(Di, field) for Di in D_list]
+        assert val.shape == (2*n_records,) + expected[0].shape[1:]
+        assert np.array_equal(np.ma.getdata(val),
+            np.concatenate([np.ma.getdata(v) for v in expected]))
+        # masks of the 20Hz fields are kept for each file
+        if np.ma.isMaskedArray(expected[0]):
+            assert np.array_equal(np.ma.getmaskarray(val),
+                np.concatenate([np.ma.getmaskarray(v) for v in expected]))
+    assert np.ma.count_masked(D.Lat) == 2*np.sum(20 - _N_VALID)
+
+# Baseline-D netCDF4 variables (1Hz and 20Hz) read by the reader
+_NC_VARIABLES_01 = ['lat_01','lon_01','alt_01','off_nadir_roll_angle_str_01',
+    'off_nadir_pitch_angle_str_01','off_nadir_yaw_angle_str_01','num_valid_01',
+    'mod_dry_tropo_cor_01','mod_wet_tropo_cor_01','inv_bar_cor_01',
+    'hf_fluct_total_cor_01','iono_cor_01','iono_cor_gim_01','sea_state_bias_01_ku',
+    'ocean_tide_01','ocean_tide_eq_01','load_tide_01','solid_earth_tide_01',
+    'pole_tide_01','geoid_01','mean_sea_surf_sea_ice_01','odle_01',
+    'sea_ice_concentration_01','snow_depth_01','snow_density_01',
+    'flag_cor_err_01','swh_ocean_01_ku','wind_speed_alt_01_ku']
+_NC_VARIABLES_20_KU = ['time_20_ku','lat_poca_20_ku','lon_poca_20_ku',
+    'height_1_20_ku','height_2_20_ku','height_3_20_ku','sig0_1_20_ku',
+    'sig0_2_20_ku','sig0_3_20_ku','range_1_20_ku','range_2_20_ku','range_3_20_ku',
+    'freeboard_20_ku','height_sea_ice_floe_20_ku','height_sea_ice_lead_20_ku',
+    'ssha_interp_20_ku','ssha_interp_numval_20_ku','ssha_interp_rms_20_ku',
+    'peakiness_20_ku','echo_avg_numval_20_ku','flag_prod_status_20_ku',
+    'flag_cor_applied_20_ku','flag_instr_mode_op_20_ku','surf_type_20_ku',
+    'retracker_1_quality_20_ku','retracker_2_quality_20_ku',
+    'retracker_3_quality_20_ku']
+# global attributes assigned to the MPH and SPH metadata
+_NC_ATTRIBUTES = ['product_name','doi','processing_stage','reference_document',
+    'acquisition_station','processing_centre','creation_time','software_version',
+    'sensing_start','sensing_stop','phase','cycle_number','rel_orbit_number',
+    'abs_orbit_number','state_vector_time','delta_ut1','x_position','y_position',
+    'z_position','x_velocity','y_velocity','z_velocity','vector_source',
+    'leap_utc','leap_sign','leap_err','product_err','first_record_time',
+    'last_record_time','abs_orbit_start','rel_time_acs_node_start',
+    'abs_orbit_stop','rel_time_acs_node_stop','equator_cross_time',
+    'equator_cross_long','ascending_flag','first_record_lat','first_record_lon',
+    'last_record_lat','last_record_lon','l1b_proc_flag','l1b_processing_quality',
+    'l1b_proc_thresh','instr_id','lrm_mode_percent','sar_mode_percent',
+    'sarin_mode_percent','open_ocean_percent','close_sea_percent',
+    'continent_ice_percent','land_percent','l2_prod_status','l2_proc_flag',
+    'l2_processing_quality','l2_proc_thresh','sir_configuration','sir_op_mode',
+    'xref_orbit','xref_pconf','xref_constants','xref_siral_characterisation',
+    'xref_uso','xref_star_tracker_attref','xref_siral_l0','xref_cal1',
+    'xref_cal1_sarin','xref_orbit_scenario','xref_cal2','xref_surf_pressure',
+    'xref_mean_pressure','xref_wet_trop','xref_u_wind','xref_v_wind',
+    'xref_meteo','xref_s1s2_pressure_00h','xref_s1s2_pressure_06h',
+    'xref_s1s2_pressure_12h','xref_s1s2_pressure_18h','xref_s1_tide_amplitude',
+    'xref_s1_tide_phase','xref_s2_tide_amplitude','xref_s2_tide_phase',
+    'xref_gim','xref_dip_map','xref_iono_cor','xref_sai','xref_ocean_tide',
+    'xref_tidal_load','xref_earth_tide','xref_pole_location','xref_surf_type',
+    'xref_mog2d','xref_siral_l1b','xref_mss','xref_geoid','xref_odle']
+
+def _write_nc(filename, N_valid, ind_first_meas):
+    """
+    Write a synthetic CryoSat-2 Baseline-D netCDF4 file with known values
+    """
+    n_records = len(N_valid)
+    n_20Hz = np.max(ind_first_meas + N_valid)
+    # 1Hz times and 20Hz times within each record
+    time_cor_01 = 4.7e8 + np.arange(n_records)
+    time_20_ku = np.zeros((n_20Hz))
+    for r in range(n_records):
+        indices = ind_first_meas[r] + np.arange(N_valid[r])
+        time_20_ku[indices] = time_cor_01[r] + 0.05*np.arange(N_valid[r])
+    with netCDF4.Dataset(filename, 'w') as fid:
+        fid.createDimension('time_cor_01', n_records)
+        fid.createDimension('time_20_ku', n_20Hz)
+        fid.createVariable('time_cor_01', 'f8', ('time_cor_01',))[:] = time_cor_01
+        fid.createVariable('ind_first_meas_20hz_01', 'i4',
+            ('time_cor_01',))[:] = ind_first_meas
+        for dim, names in [('time_cor_01',_NC_VARIABLES_01),
+                           ('time_20_ku',_NC_VARIABLES_20_KU)]:
+            for name in names:
+                var = fid.createVariable(name, 'f8' if name.startswith('time') else 'i4', (dim,))
+                var[:] = np.zeros((len(fid.dimensions[dim])))
+        fid.variables['time_20_ku'][:] = time_20_ku
+        fid.variables['num_valid_01'][:] = N_valid
+        # 20Hz latitudes are the index within the flattened variable
+        fid.variables['lat_poca_20_ku'][:] = np.arange(n_20Hz)
+        for name in _NC_ATTRIBUTES:
+            fid.setncattr(name, name.upper())
+        fid.setncattr('abs_orbit_number', np.int32(12345))
+        fid.setncattr('ascending_flag', 'D')
+
+@pytest.mark.parametrize("N_valid, ind_first_meas", [
+    # every record is full and stored contiguously
+    (np.array([20, 20, 20]), np.array([0, 20, 40])),
+    # partial and empty records with a gap between records
+    (np.array([20, 7, 0, 13]), np.array([0, 25, 32, 32]))])
+def test_read_CS2_nc(tmp_path, N_valid, ind_first_meas):
+    filename = str(tmp_path / ('CS_OFFL_SIR_SIN_2__20190101T000000_'
+        '20190101T001000_D001.nc'))
+    _write_nc(filename, N_valid, ind_first_meas)
+    n_records = len(N_valid)
+    CS_l2_mds = pc.CS2.data().cryosat_baseline_D(filename)
+    # 1Hz time split into day, second and microsecond parts
+    time_cor_01 = 4.7e8 + np.arange(n_records)
+    assert np.array_equal(CS_l2_mds['Data_1Hz']['Day'], time_cor_01//86400)
+    assert np.array_equal(CS_l2_mds['Data_1Hz']['Second'], time_cor_01 % 86400)
+    assert np.array_equal(CS_l2_mds['Data_1Hz']['Micsec'], np.zeros(n_records))
+    assert np.array_equal(CS_l2_mds['Data_1Hz']['Abs_Orbit'], np.full(n_records, 12345))
+    assert not np.any(CS_l2_mds['Data_1Hz']['Ascending_flag'])
+    # 20Hz fields gathered into records and masked beyond N_valid
+    mask = np.arange(20) >= N_valid[:,None]
+    for key in ['Lat','Elev_1','Time','D_time_mics']:
+        val = CS_l2_mds['Data_20Hz'][key]
+        assert val.shape == (n_records,20)
+        assert np.array_equal(np.ma.getmaskarray(val), mask)
+    Lat = CS_l2_mds['Data_20Hz']['Lat']
+    expected = ind_first_meas[:,None] + np.arange(20)
+    assert np.array_equal(Lat.data[~mask], expected[~mask])
+    D_time_mics = CS_l2_mds['Data_20Hz']['D_time_mics']
+    expected = np.broadcast_to(50000.0*np.arange(20), (n_records,20))
+    assert np.allclose(D_time_mics.data[~mask], expected[~mask], atol=1e-3)
+    # the masks of separate variables are independent
+    Lat[0,0] = np.ma.masked
+    assert not CS_l2_mds['Data_20Hz']['Elev_1'].mask[0,0]
+    assert CS_l2_mds['METADATA']['MPH']['ABS_ORBIT'] == 12345
+    assert CS_l2_mds['METADATA']['SPH']['ASCENDING_FLAG'] == 'D'
+    assert CS_l2_mds['METADATA']['SPH']['ORBIT_FILE'] == 'XREF_ORBIT'
+    # reading a subset of fields
+    D = pc.CS2.data().from_nc(filename, field_dict={'Data_1Hz':['N_valid'],
+        'Data_20Hz':['Lat','days_J2k']})
+    assert D.fields == ['N_valid','Lat','days_J2k']
+    assert D.Lat.shape == (n_records,20)
+    assert np.array_equal(np.ma.getmaskarray(D.days_J2k), mask)
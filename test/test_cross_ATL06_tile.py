@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Round trip of crossover slopes through write_xovers and read_xovers
+"""
+import os
+import sys
+import inspect
+import h5py
+import numpy as np
+import pointCollection as pc
+
+# the crossover routines live in the scripts directory
+filename = inspect.getframeinfo(inspect.currentframe()).filename
+filepath = os.path.dirname(os.path.abspath(filename))
+sys.path.insert(0, os.path.join(filepath,'..','scripts'))
+import cross_ATL06_tile
+
+# crossover locations, along-track positions and surface slopes
+xyC = np.array([[-2000., 1000.], [3000., -500.], [5000., 2500.]])
+L0 = np.array([0.25, 0.5, 0.9])
+L1 = np.array([0.6, 0.1, 0.35])
+slope_x = np.array([0.01, -0.002, 0.])
+slope_y = np.array([-0.005, 0.003, 0.02])
+
+def make_xovers():
+    # two segments along x for data_0 and two along y for data_1, with
+    # heights on a plane with a different offset for each track
+    xovers = []
+    for ii, (x0, y0) in enumerate(xyC):
+        D = []
+        for dx, dy, offset in [([-20, 20], [0, 0], 100.),
+                               ([0, 0], [-20, 20], 101.5)]:
+            x = x0 + np.array(dx, dtype=float)
+            y = y0 + np.array(dy, dtype=float)
+            h_li = offset + slope_x[ii]*x + slope_y[ii]*y
+            D += [pc.data().from_dict({'x':x, 'y':y, 'h_li':h_li})]
+        xovers.append({'xyC':[x0, y0], 'data_0':D[0], 'data_1':D[1],
+            'L0':L0[ii], 'L1':L1[ii]})
+    return xovers
+
+def from_geotif(self, filename, bounds=None, **kwargs):
+    # in-memory mask: ones west of x=0 and zeros to the east
+    x = np.arange(-10000., 10001., 100.)
+    y = np.arange(-10000., 10001., 100.)
+    z = np.zeros((y.size, x.size))
+    z[:, x < 0] = 1
+    return self.from_dict({'x':x, 'y':y, 'z':z})
+
+def test_xover_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(pc.grid.data, 'from_geotif', from_geotif)
+    xovers = make_xovers()
+    cross_ATL06_tile.calc_slope(xovers, 'mask.tif', hemisphere=-1)
+    assert np.allclose([xo['slope_x'] for xo in xovers], slope_x)
+    assert np.allclose([xo['slope_y'] for xo in xovers], slope_y)
+    assert [xo['masked'] for xo in xovers] == [True, False, False]
+    # write the crossovers to a tile and read them back
+    out_file = os.path.join(tmp_path, 'E0_N0.h5')
+    cross_ATL06_tile.write_xovers(xovers, out_file)
+    with h5py.File(out_file, 'r') as h5f:
+        assert np.allclose(h5f['slope_x'][()], slope_x)
+        assert np.allclose(h5f['slope_y'][()], slope_y)
+        assert np.all(h5f['masked'][()] == [True, False, False])
+    D, X = cross_ATL06_tile.read_xovers(str(tmp_path), n_workers=2)
+    assert len(D) == 1 and len(X) == 1
+    D0, D1 = D[0]
+    assert np.allclose(X[0].x, xyC[:,0])
+    assert np.allclose(X[0].y, xyC[:,1])
+    assert np.allclose(D0.W, np.c_[1-L0, L0])
+    assert np.allclose(D1.W, np.c_[1-L1, L1])
+    for Di, key in zip([D0, D1], ['data_0', 'data_1']):
+        assert Di.h_li.shape == (xyC.shape[0], 2)
+        assert np.allclose(Di.h_li, [xo[key].h_li for xo in xovers])
+        assert np.allclose(Di.x, [xo[key].x for xo in xovers])
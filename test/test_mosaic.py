@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the weights of a mosaic tile
+"""
+import numpy as np
+import pointCollection as pc
+
+def raised_cosine(xy, pad, feather):
+    # 1-D raised cosine taper from the center of the tile to its edges
+    dist = np.abs(xy - np.mean(xy))
+    edge = (xy[-1] - xy[0])/2 - pad
+    wt = 0.5 + 0.5*np.cos(np.pi*(dist - (edge - feather))/feather)
+    wt[dist <= edge - feather] = 1
+    wt[dist >= edge] = 0
+    return wt
+
+def test_mosaic_weights():
+    # non-square tile: 41 columns by 21 rows with 3 bands
+    x = np.arange(41)*10.0
+    y = np.arange(21)*10.0
+    z = np.ones((y.size, x.size, 3))
+    tile = pc.grid.mosaic(spacing=[10.0, 10.0])
+    tile.x, tile.y = x, y
+    tile.assign({'z':z})
+    tile.weights(pad=20, feather=40, apply=True)
+    assert tile.weight.shape == (y.size, x.size)
+    # taper along the columns (x) and along the rows (y)
+    wt_x = raised_cosine(x, 20, 40)
+    wt_y = raised_cosine(y, 20, 40)
+    assert np.allclose(tile.weight[y.size//2,:], wt_x)
+    assert np.allclose(tile.weight[:,x.size//2], wt_y)
+    assert np.allclose(tile.weight, wt_y[:,None]*wt_x[None,:])
+    # the x and y tapers differ for a non-square tile
+    assert not np.allclose(wt_x[:y.size], wt_y)
+    # weights are applied to every band
+    for band in range(3):
+        assert np.allclose(tile.z[:,:,band], tile.weight)